@@ -3,14 +3,27 @@
 import argparse
 import json
 import logging
+import os
+import queue
+import shutil
 import sys
-import tempfile
-import traceback
+import threading
+import uuid
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
 from dotenv import load_dotenv
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .audio import combine_audio_segments
+from .cache import CACHE_DIR_NAME, DEFAULT_CACHE_MAX_BYTES, FileCache
 from .clients import GTTSEstimator, LLMClient, TTSClient
 from .parsers import Subtitle, parse_srt
 from .processors import AudioTagProcessor, SubtitleProcessor
@@ -20,6 +33,107 @@ logger = logging.getLogger(__name__)
 # 前後何エントリーをコンテキストとして使用するか
 CONTEXT_WINDOW = 2
 
+# 同時に処理する字幕数のデフォルト値（プロバイダのレート制限を考慮）
+DEFAULT_MAX_CONCURRENCY = 3
+
+# 同時に実行するLLMタグ付けリクエスト数のデフォルト値
+DEFAULT_LLM_CONCURRENCY = 8
+# 1回のLLMリクエストでタグ付けする字幕数
+TAG_BATCH_SIZE = 20
+
+
+def _build_contexts(subtitles: list[Subtitle]) -> list[dict]:
+    """
+    各字幕の前後コンテキストを事前に構築する
+
+    Args:
+        subtitles: 字幕データのリスト
+
+    Returns:
+        SubtitleProcessor.processにキーワード引数として渡せる辞書のリスト
+    """
+    # 属性アクセスを1回に抑えるため、テキストと時刻を先に配列化する
+    texts = [s.text for s in subtitles]
+    starts = [s.start_ms for s in subtitles]
+    ends = [s.end_ms for s in subtitles]
+    last = len(subtitles) - 1
+
+    return [
+        {
+            "prev_texts": texts[max(0, i - CONTEXT_WINDOW) : i] or None,
+            "next_texts": texts[i + 1 : i + 1 + CONTEXT_WINDOW] or None,
+            "prev_entry_end_ms": ends[i - 1] if i > 0 else None,
+            "next_entry_start_ms": starts[i + 1] if i < last else None,
+        }
+        for i in range(len(subtitles))
+    ]
+
+
+@contextmanager
+def _work_dir(output_path: Path, keep: bool = False) -> Iterator[Path]:
+    """
+    中間音声ファイル用の作業ディレクトリを用意する
+
+    出力先の隣（.work/<出力名>）に作成し、終了後はバックグラウンドで削除する。
+    字幕数が多いと削除に時間がかかるため、呼び出し元を待たせない。
+
+    Args:
+        output_path: 出力音声ファイルのパス
+        keep: Trueの場合は削除せずに残す（デバッグ用）
+
+    Yields:
+        作業ディレクトリのパス
+    """
+    work_path = output_path.parent / ".work" / output_path.stem
+    # 前回の実行で残ったファイルを混ぜないよう空の状態から始める
+    _discard_dir(work_path)
+    work_path.mkdir(parents=True, exist_ok=True)
+    try:
+        yield work_path
+    finally:
+        if keep:
+            logger.info(f"[作業ディレクトリ] 保持: {work_path}")
+        else:
+            _discard_dir(work_path)
+
+
+def _discard_dir(path: Path) -> None:
+    """
+    ディレクトリを別名に移してからバックグラウンドで削除する
+
+    移動は一瞬で終わるため、同じパスをすぐに作り直せる。
+    移動できない場合はその場で削除する。
+
+    Args:
+        path: 削除するディレクトリ（存在しない場合は何もしない）
+    """
+    if not path.exists():
+        return
+    stale_path = path.with_name(f"{path.name}.stale-{uuid.uuid4().hex}")
+    try:
+        path.rename(stale_path)
+    except OSError:
+        shutil.rmtree(path, ignore_errors=True)
+        return
+    # 非デーモンスレッドなのでプロセス終了前に削除は完了する
+    threading.Thread(
+        target=shutil.rmtree, args=(stale_path,), kwargs={"ignore_errors": True}
+    ).start()
+
+
+def _cancel_pending(*pools: ThreadPoolExecutor) -> None:
+    """
+    未着手のタスクを取り消す
+
+    1件でも失敗したら残りの字幕を処理しても結果は使われないため、
+    キューに積まれたAPI呼び出しを走らせずに打ち切る（実行中のタスクは完了を待つ）。
+
+    Args:
+        *pools: 取り消し対象のスレッドプール
+    """
+    for pool in pools:
+        pool.shutdown(wait=False, cancel_futures=True)
+
 
 def save_tagged_json(
     srt_path: Path,
@@ -38,22 +152,43 @@ def save_tagged_json(
         output_path: 出力JSONファイルのパス
         durations_ms: 音声長のリスト（ミリ秒）、Noneの場合は出力しない
     """
-    print(f"[JSON保存開始] {output_path}")
-
-    subtitle_data = []
-    for i, (subtitle, tagged_text) in enumerate(zip(subtitles, tagged_texts)):
-        entry = {
-            "index": subtitle.index,
-            "start_ms": subtitle.start_ms,
-            "end_ms": subtitle.end_ms,
-            "available_ms": subtitle.end_ms - subtitle.start_ms,
-            "original_text": subtitle.text,
-            "tagged_text": tagged_text,
-        }
-        if durations_ms is not None:
-            entry["duration_ms"] = durations_ms[i]
-            entry["overflow_ms"] = max(0, durations_ms[i] - entry["available_ms"])
-        subtitle_data.append(entry)
+    logger.info(f"[JSON保存開始] {output_path}")
+
+    # 各エントリーは辞書リテラル1回で構築する（キー追加による再ハッシュを避ける）
+    if durations_ms is None:
+        subtitle_data = [
+            {
+                "index": subtitle.index,
+                "start_ms": subtitle.start_ms,
+                "end_ms": subtitle.end_ms,
+                "available_ms": subtitle.end_ms - subtitle.start_ms,
+                "original_text": subtitle.text,
+                "tagged_text": tagged_text,
+            }
+            for subtitle, tagged_text in zip(subtitles, tagged_texts)
+        ]
+        overflow_count = 0
+    else:
+        overflows = [
+            max(0, duration_ms - (subtitle.end_ms - subtitle.start_ms))
+            for subtitle, duration_ms in zip(subtitles, durations_ms)
+        ]
+        subtitle_data = [
+            {
+                "index": subtitle.index,
+                "start_ms": subtitle.start_ms,
+                "end_ms": subtitle.end_ms,
+                "available_ms": subtitle.end_ms - subtitle.start_ms,
+                "original_text": subtitle.text,
+                "tagged_text": tagged_text,
+                "duration_ms": duration_ms,
+                "overflow_ms": overflow_ms,
+            }
+            for subtitle, tagged_text, duration_ms, overflow_ms in zip(
+                subtitles, tagged_texts, durations_ms, overflows
+            )
+        ]
+        overflow_count = sum(1 for overflow_ms in overflows if overflow_ms > 0)
 
     data = {
         "source": srt_path.name,
@@ -62,22 +197,121 @@ def save_tagged_json(
 
     try:
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        print(f"[JSON保存] ディレクトリ確認OK: {output_path.parent}")
+        logger.info(f"[JSON保存] ディレクトリ確認OK: {output_path.parent}")
 
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        if orjson is not None:
+            # C実装でUTF-8を直接出力する（標準jsonのindent処理より高速）
+            output_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
 
-        print(f"[JSON保存完了] {output_path}")
-        print(f"[JSON内容プレビュー] {len(data['subtitles'])}件の字幕")
+        logger.info(f"[JSON保存完了] {output_path}")
+        logger.info(f"[JSON内容プレビュー] {len(data['subtitles'])}件の字幕")
 
         # 時間超過の警告を表示
-        if durations_ms is not None:
-            overflow_count = sum(1 for entry in subtitle_data if entry.get("overflow_ms", 0) > 0)
-            if overflow_count > 0:
-                print(f"[警告] {overflow_count}件の字幕が時間枠を超過しています")
+        if overflow_count > 0:
+            logger.warning(f"[警告] {overflow_count}件の字幕が時間枠を超過しています")
     except Exception as e:
-        print(f"[JSON保存エラー] {e}")
-        traceback.print_exc()
+        logger.exception(f"[JSON保存エラー] {e}")
+
+
+def _submit_tagging(
+    pool: ThreadPoolExecutor,
+    subtitles: list[Subtitle],
+    contexts: list[dict],
+    subtitle_processor: SubtitleProcessor,
+) -> list[tuple[Future, int]]:
+    """
+    全字幕のオーディオタグ付与をバッチ単位でプールに投入する
+
+    タグ付けは前後コンテキストにのみ依存するため、TTSの完了を待たずに
+    全エントリー分を同時に投げられる。TAG_BATCH_SIZE件ずつ1リクエストに
+    まとめ、バッチ単位で並列実行する。
+
+    Args:
+        pool: LLMリクエスト用のスレッドプール
+        subtitles: 字幕データのリスト
+        contexts: _build_contextsで構築したコンテキスト
+        subtitle_processor: 字幕プロセッサ
+
+    Returns:
+        字幕ごとの(バッチのFuture, バッチ内の位置)のリスト。
+        タグ付きテキストは future.result()[位置] で取り出す（タグ付けを保留した字幕はNone）
+    """
+    if subtitle_processor.audio_tag_processor:
+        logger.info(f"オーディオタグ付与中... ({len(subtitles)}件)")
+
+    slots: list[tuple[Future, int]] = []
+    for i in range(0, len(subtitles), TAG_BATCH_SIZE):
+        batch_subtitles = subtitles[i : i + TAG_BATCH_SIZE]
+        future = pool.submit(
+            subtitle_processor.tag_batch, batch_subtitles, contexts[i : i + TAG_BATCH_SIZE]
+        )
+        slots.extend((future, offset) for offset in range(len(batch_subtitles)))
+    return slots
+
+
+def _tag_all(
+    subtitles: list[Subtitle],
+    contexts: list[dict],
+    subtitle_processor: SubtitleProcessor,
+    max_workers: int,
+) -> list[str]:
+    """
+    全字幕のオーディオタグ付与を並列実行し、完了まで待つ
+
+    Args:
+        subtitles: 字幕データのリスト
+        contexts: _build_contextsで構築したコンテキスト
+        subtitle_processor: 字幕プロセッサ
+        max_workers: 同時に実行するLLMリクエスト数の上限
+
+    Returns:
+        字幕と同じ順序のタグ付きテキストのリスト
+    """
+    if not subtitle_processor.audio_tag_processor:
+        return [subtitle.text for subtitle in subtitles]
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        slots = _submit_tagging(pool, subtitles, contexts, subtitle_processor)
+        try:
+            # TTSなしのモードではタグ付けは保留されないが、念のため元テキストで埋める
+            results = [future.result()[offset] for future, offset in slots]
+            return [
+                text if text is not None else subtitle.text
+                for subtitle, text in zip(subtitles, results)
+            ]
+        except BaseException:
+            _cancel_pending(pool)
+            raise
+
+
+def _process_gtts_entry(
+    subtitle: Subtitle,
+    text: str,
+    gtts_estimator: GTTSEstimator,
+    temp_path: Path,
+    lang: str,
+) -> tuple[Path | None, int]:
+    """
+    gTTSのみモードで1つの字幕を音声化する
+
+    Args:
+        subtitle: 字幕データ
+        text: 音声化するテキスト（タグ付け済み）
+        gtts_estimator: gTTSクライアント
+        temp_path: 一時ファイル用ディレクトリ
+        lang: gTTSの言語コード
+
+    Returns:
+        (音声ファイルパス, 音声長ms)のタプル（読み上げる文字がない場合のパスはNone）
+    """
+    logger.info(f"処理中: [{subtitle.index}] {subtitle.text[:30]}...")
+
+    # gTTSで音声を生成
+    audio_path = temp_path / f"gtts_{subtitle.index}.mp3"
+    return gtts_estimator.synthesize(text, audio_path, lang=lang)
 
 
 def process_srt_file(
@@ -92,6 +326,9 @@ def process_srt_file(
     margin_ms: int = 100,
     estimation_ratio: float | None = 0.9,
     lang: str = "ja",
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    use_cache: bool = True,
+    llm_concurrency: int = DEFAULT_LLM_CONCURRENCY,
 ) -> None:
     """
     SRTファイルを処理して音声ファイルを生成する
@@ -108,165 +345,272 @@ def process_srt_file(
         margin_ms: エントリー間の最低マージン（ミリ秒）
         estimation_ratio: gTTS事前見積もりの補正係数（Noneで無効化）
         lang: gTTSの言語コード（デフォルト: ja）
+        max_concurrency: 同時に処理する字幕数の上限
+        use_cache: LLM応答と合成音声のディスクキャッシュを使用するか
+        llm_concurrency: 同時に実行するLLMタグ付けリクエスト数の上限
     """
-    print(f"処理開始: {srt_path}")
-    print(f"出力先: {output_path}")
-    print(f"オーディオタグ使用: {use_audio_tags}")
-    print(f"JSONのみ: {json_only}")
-    print(f"gTTSのみ: {gtts_only}")
-    print(f"デバッグモード: {debug}")
-    print(f"速度調整閾値: {speed_threshold}")
-    print(f"最大リトライ回数: {max_shorten_retries}")
-    print(f"エントリー間マージン: {margin_ms}ms")
-    print(f"gTTS事前見積もり: {f'有効 (補正係数: {estimation_ratio})' if estimation_ratio else '無効'}")
-    print(f"gTTS言語: {lang}")
+    logger.info(f"処理開始: {srt_path}")
+    logger.info(f"出力先: {output_path}")
+    logger.info(f"オーディオタグ使用: {use_audio_tags}")
+    logger.info(f"JSONのみ: {json_only}")
+    logger.info(f"gTTSのみ: {gtts_only}")
+    logger.info(f"デバッグモード: {debug}")
+    logger.info(f"速度調整閾値: {speed_threshold}")
+    logger.info(f"最大リトライ回数: {max_shorten_retries}")
+    logger.info(f"エントリー間マージン: {margin_ms}ms")
+    logger.info(f"gTTS事前見積もり: {f'有効 (補正係数: {estimation_ratio})' if estimation_ratio else '無効'}")
+    logger.info(f"gTTS言語: {lang}")
+    logger.info(f"最大同時処理数: {max_concurrency}")
+    logger.info(f"キャッシュ使用: {use_cache}")
+    logger.info(f"LLM同時リクエスト数: {llm_concurrency}")
 
     # SRTをパース
     subtitles = parse_srt(srt_path)
-    print(f"字幕数: {len(subtitles)}")
+    logger.info(f"字幕数: {len(subtitles)}")
+
+    # ディスクキャッシュを初期化（出力先ディレクトリの.cache配下、音声は容量上限付き）
+    cache_dir = output_path.parent / CACHE_DIR_NAME
+    llm_cache = FileCache(cache_dir / "llm") if use_cache else None
+    audio_cache = FileCache(cache_dir / "tts", max_bytes=DEFAULT_CACHE_MAX_BYTES) if use_cache else None
+    gtts_cache = FileCache(cache_dir / "gtts", max_bytes=DEFAULT_CACHE_MAX_BYTES) if use_cache else None
+
+    # HTTPセッションは処理が失敗した場合も閉じる
+    with ExitStack() as clients:
+        # TTSクライアントを初期化（json_onlyまたはgtts_onlyの場合はスキップ）
+        tts_client = None
+        if not json_only and not gtts_only:
+            tts_client = clients.enter_context(TTSClient())
+            logger.info("[TTS] クライアント初期化完了")
+
+        # オーディオタグプロセッサを初期化
+        llm_client = None
+        audio_tag_processor = None
+        if use_audio_tags:
+            try:
+                llm_client = clients.enter_context(LLMClient(cache=llm_cache))
+                audio_tag_processor = AudioTagProcessor(llm_client, debug=debug)
+                logger.info("[LLM] オーディオタグプロセッサ初期化完了")
+            except ValueError as e:
+                logger.warning(f"[LLM] オーディオタグ無効: {e}")
+            except Exception as e:
+                logger.exception(f"[LLM] 初期化エラー: {e}")
+
+        # gTTSクライアントを初期化（gtts_onlyまたは事前見積もり用）
+        gtts_estimator = None
+        if gtts_only or (estimation_ratio is not None and not json_only):
+            ratio = estimation_ratio if estimation_ratio is not None else 1.0
+            gtts_estimator = GTTSEstimator(estimation_ratio=ratio, cache=gtts_cache)
+            if gtts_only:
+                logger.info("[gTTS] gTTSのみモードで初期化完了")
+            else:
+                logger.info(f"[gTTS] 事前見積もりクライアント初期化完了 (補正係数: {ratio})")
+                try:
+                    ms_per_char = gtts_estimator.calibrate([s.text for s in subtitles], lang=lang)
+                    if ms_per_char is not None:
+                        logger.info(f"[gTTS] 文字数モデル較正完了: {ms_per_char:.1f}ms/文字")
+                except Exception as e:
+                    logger.warning(f"[gTTS] 文字数モデル較正エラー: {e}")
+
+        # 字幕プロセッサを初期化
+        subtitle_processor = SubtitleProcessor(
+            tts_client=tts_client,
+            audio_tag_processor=audio_tag_processor,
+            speed_threshold=speed_threshold,
+            max_shorten_retries=max_shorten_retries,
+            margin_ms=margin_ms,
+            gtts_estimator=gtts_estimator,
+            lang=lang,
+            audio_cache=audio_cache,
+        )
 
-    # TTSクライアントを初期化（json_onlyまたはgtts_onlyの場合はスキップ）
-    tts_client = None
-    if not json_only and not gtts_only:
-        tts_client = TTSClient()
-        print("[TTS] クライアント初期化完了")
+        # 処理
+        audio_segments: list[tuple[int, Path]] = []
+        tagged_texts: list[str] = []
+        durations_ms: list[int] = []
+
+        # 前後コンテキストは全モード共通なので一度だけ構築する
+        contexts = _build_contexts(subtitles)
+
+        if json_only:
+            # JSONのみモード：タグ付け結果をそのまま出力
+            tagged_texts = _tag_all(subtitles, contexts, subtitle_processor, llm_concurrency)
+
+        elif gtts_only:
+            # gTTSのみモード：ElevenLabsを使わずgTTSで音声生成
+            pretagged_texts = _tag_all(subtitles, contexts, subtitle_processor, llm_concurrency)
+            with _work_dir(output_path, keep=debug) as temp_path:
+
+                # gTTSの取得は相互に独立したネットワークI/Oなので並列に投げる
+                with ThreadPoolExecutor(max_workers=max_concurrency) as pool:
+                    futures = []
+                    for subtitle, pretagged_text in zip(subtitles, pretagged_texts):
+                        futures.append(
+                            pool.submit(
+                                _process_gtts_entry,
+                                subtitle,
+                                pretagged_text,
+                                gtts_estimator,
+                                temp_path,
+                                lang,
+                            )
+                        )
+
+                    # 投入順に結果を回収して字幕との対応を保つ
+                    try:
+                        for subtitle, pretagged_text, future in zip(subtitles, pretagged_texts, futures):
+                            audio_path, duration_ms = future.result()
+                            tagged_texts.append(pretagged_text)
+                            durations_ms.append(duration_ms)
+                            if audio_path is None:
+                                logger.info(
+                                    f"    [gTTS生成] [{subtitle.index}] 読み上げる文字がないためスキップ"
+                                )
+                                continue
+                            audio_segments.append((subtitle.start_ms, audio_path))
+                            logger.info(f"    [gTTS生成] [{subtitle.index}] {duration_ms}ms")
+                    except BaseException:
+                        _cancel_pending(pool)
+                        raise
+
+                # 全ての音声を結合
+                logger.info("音声を結合中...")
+                combine_audio_segments(audio_segments, output_path)
 
-    # オーディオタグプロセッサを初期化
-    audio_tag_processor = None
-    if use_audio_tags:
-        try:
-            llm_client = LLMClient()
-            audio_tag_processor = AudioTagProcessor(llm_client, debug=debug)
-            print("[LLM] オーディオタグプロセッサ初期化完了")
-        except ValueError as e:
-            print(f"[LLM] オーディオタグ無効: {e}")
-        except Exception as e:
-            print(f"[LLM] 初期化エラー: {e}")
-            traceback.print_exc()
-
-    # gTTSクライアントを初期化（gtts_onlyまたは事前見積もり用）
-    gtts_estimator = None
-    if gtts_only or (estimation_ratio is not None and not json_only):
-        ratio = estimation_ratio if estimation_ratio is not None else 1.0
-        gtts_estimator = GTTSEstimator(estimation_ratio=ratio)
-        if gtts_only:
-            print("[gTTS] gTTSのみモードで初期化完了")
         else:
-            print(f"[gTTS] 事前見積もりクライアント初期化完了 (補正係数: {ratio})")
-
-    # 字幕プロセッサを初期化
-    subtitle_processor = SubtitleProcessor(
-        tts_client=tts_client,
-        audio_tag_processor=audio_tag_processor,
-        speed_threshold=speed_threshold,
-        max_shorten_retries=max_shorten_retries,
-        margin_ms=margin_ms,
-        gtts_estimator=gtts_estimator,
-        lang=lang,
-    )
+            # 通常モード：一時ディレクトリで処理
+            with _work_dir(output_path, keep=debug) as temp_path:
+
+                # タグ付け（LLM）・TTS（ネットワーク待ち）・速度調整（ffmpegのCPU処理）を
+                # 別プールで実行する。各字幕のTTSは自分のタグ付けバッチの完了だけを待つので、
+                # 先頭のバッチが返った時点で後続のタグ付けと並行してTTSが始まる
+                with (
+                    ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as cpu_pool,
+                    ThreadPoolExecutor(max_workers=llm_concurrency) as llm_pool,
+                ):
+                    tag_slots = _submit_tagging(llm_pool, subtitles, contexts, subtitle_processor)
+
+                    def run(subtitle: Subtitle, context: dict, tag_slot: tuple[Future, int]) -> Future:
+                        tag_future, offset = tag_slot
+                        tagged_text = tag_future.result()[offset]
+                        logger.info(f"処理中: [{subtitle.index}] {subtitle.text[:30]}...")
+                        entry = subtitle_processor.synthesize(
+                            subtitle,
+                            temp_path,
+                            tagged_text=tagged_text,
+                            tagging_deferred=tagged_text is None,
+                            **context,
+                        )
+                        return cpu_pool.submit(subtitle_processor.finalize, entry, temp_path)
+
+                    with ThreadPoolExecutor(max_workers=max_concurrency) as net_pool:
+                        futures = []
+                        for subtitle, context, tag_slot in zip(subtitles, contexts, tag_slots):
+                            futures.append(net_pool.submit(run, subtitle, context, tag_slot))
+
+                        # 投入順に結果を回収して字幕との対応を保つ
+                        try:
+                            for future in futures:
+                                start_ms, audio_path, tagged_text = future.result().result()
+                                if audio_path:
+                                    audio_segments.append((start_ms, audio_path))
+                                tagged_texts.append(tagged_text)
+                        except BaseException:
+                            _cancel_pending(net_pool, llm_pool, cpu_pool)
+                            raise
+
+                # 全ての音声を結合
+                logger.info("音声を結合中...")
+                combine_audio_segments(audio_segments, output_path)
+
+        # タグ付きJSONを保存
+        json_output_path = output_path.with_suffix(".json")
+        save_tagged_json(
+            srt_path,
+            subtitles,
+            tagged_texts,
+            json_output_path,
+            durations_ms=durations_ms if durations_ms else None,
+        )
 
-    # 処理
-    audio_segments: list[tuple[int, Path]] = []
-    tagged_texts: list[str] = []
-    durations_ms: list[int] = []
-
-    if json_only:
-        # JSONのみモード：一時ディレクトリ不要
-        for i, subtitle in enumerate(subtitles):
-            print(f"処理中: [{subtitle.index}] {subtitle.text[:30]}...")
-            prev_texts = [s.text for s in subtitles[max(0, i - CONTEXT_WINDOW) : i]]
-            next_texts = [s.text for s in subtitles[i + 1 : i + 1 + CONTEXT_WINDOW]]
-            prev_entry_end_ms = subtitles[i - 1].end_ms if i > 0 else None
-            next_entry_start_ms = subtitles[i + 1].start_ms if i < len(subtitles) - 1 else None
-
-            _, _, tagged_text = subtitle_processor.process(
-                subtitle,
-                temp_dir=None,
-                prev_texts=prev_texts if prev_texts else None,
-                next_texts=next_texts if next_texts else None,
-                prev_entry_end_ms=prev_entry_end_ms,
-                next_entry_start_ms=next_entry_start_ms,
-            )
-            tagged_texts.append(tagged_text)
+    # キャッシュの効き具合を出力
+    for cache in (llm_cache, audio_cache, gtts_cache):
+        if not cache:
+            continue
+        for name, (hits, misses) in cache.stats().items():
+            logger.info(f"[キャッシュ] {name}: ヒット {hits}件 / ミス {misses}件")
+        removed = cache.prune()
+        if removed:
+            logger.info(f"[キャッシュ] 容量上限を超えたため{removed}件を削除: {cache.root}")
 
-    elif gtts_only:
-        # gTTSのみモード：ElevenLabsを使わずgTTSで音声生成
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
+    logger.info(f"完了: {output_path}")
 
-            for i, subtitle in enumerate(subtitles):
-                print(f"処理中: [{subtitle.index}] {subtitle.text[:30]}...")
-                prev_texts = [s.text for s in subtitles[max(0, i - CONTEXT_WINDOW) : i]]
-                next_texts = [s.text for s in subtitles[i + 1 : i + 1 + CONTEXT_WINDOW]]
 
-                # オーディオタグを付与
-                text = subtitle.text
-                if audio_tag_processor:
-                    try:
-                        tagged_text = audio_tag_processor.add_tags(
-                            text,
-                            prev_texts=prev_texts if prev_texts else None,
-                            next_texts=next_texts if next_texts else None,
-                            entry_index=subtitle.index,
-                        )
-                        print(f"    [タグ付与成功]")
-                        text = tagged_text
-                    except Exception as e:
-                        print(f"    [タグ付与エラー] {e}")
+def _run(args: argparse.Namespace) -> None:
+    """コマンドライン引数に従って処理を実行する"""
+    input_path = Path(args.input)
+    if not input_path.exists():
+        logger.error(f"エラー: ファイルが見つかりません: {input_path}")
+        sys.exit(1)
+
+    if args.output:
+        output_path = Path(args.output)
+    else:
+        suffix = ".json" if args.json_only else ".mp3"
+        output_path = Path("output") / f"{input_path.stem}{suffix}"
+
+    # estimation_ratioが0以下の場合は無効化
+    estimation_ratio = args.estimation_ratio if args.estimation_ratio > 0 else None
+
+    process_srt_file(
+        input_path,
+        output_path,
+        use_audio_tags=not args.no_tags,
+        json_only=args.json_only,
+        gtts_only=args.gtts_only,
+        debug=args.debug,
+        speed_threshold=args.speed_threshold,
+        max_shorten_retries=args.max_shorten_retries,
+        margin_ms=args.margin_ms,
+        estimation_ratio=estimation_ratio,
+        lang=args.lang,
+        max_concurrency=max(1, args.max_concurrency),
+        use_cache=not args.no_cache,
+        llm_concurrency=max(1, args.llm_concurrency),
+    )
 
-                tagged_texts.append(text)
 
-                # gTTSで音声を生成
-                audio_path = temp_path / f"gtts_{subtitle.index}.mp3"
-                _, duration_ms = gtts_estimator.synthesize(text, audio_path, lang=lang)
-                durations_ms.append(duration_ms)
-                audio_segments.append((subtitle.start_ms, audio_path))
+def _configure_logging(debug: bool, quiet: bool) -> QueueListener:
+    """
+    ロギングを設定する
 
-                print(f"    [gTTS生成] {duration_ms}ms")
+    通常はINFO、デバッグモードでは詳細形式のDEBUG、quietではWARNING以上のみを出力する。
+    ワーカースレッドはキューに積むだけにし、出力は専用スレッドが行う。
 
-            # 全ての音声を結合
-            print("音声を結合中...")
-            combine_audio_segments(audio_segments, output_path)
+    Args:
+        debug: デバッグモードか
+        quiet: 警告とエラーのみを出力するか
 
+    Returns:
+        開始済みのリスナー（終了時にstop()を呼ぶ）
+    """
+    handler = logging.StreamHandler()
+    if debug:
+        level = logging.DEBUG
+        handler.setFormatter(
+            logging.Formatter("%(asctime)s [%(name)s] %(levelname)s: %(message)s", datefmt="%H:%M:%S")
+        )
     else:
-        # 通常モード：一時ディレクトリで処理
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            for i, subtitle in enumerate(subtitles):
-                print(f"処理中: [{subtitle.index}] {subtitle.text[:30]}...")
-                prev_texts = [s.text for s in subtitles[max(0, i - CONTEXT_WINDOW) : i]]
-                next_texts = [s.text for s in subtitles[i + 1 : i + 1 + CONTEXT_WINDOW]]
-                prev_entry_end_ms = subtitles[i - 1].end_ms if i > 0 else None
-                next_entry_start_ms = subtitles[i + 1].start_ms if i < len(subtitles) - 1 else None
-
-                start_ms, audio_path, tagged_text = subtitle_processor.process(
-                    subtitle,
-                    temp_dir=temp_path,
-                    prev_texts=prev_texts if prev_texts else None,
-                    next_texts=next_texts if next_texts else None,
-                    prev_entry_end_ms=prev_entry_end_ms,
-                    next_entry_start_ms=next_entry_start_ms,
-                )
-                if audio_path:
-                    audio_segments.append((start_ms, audio_path))
-                tagged_texts.append(tagged_text)
-
-            # 全ての音声を結合
-            print("音声を結合中...")
-            combine_audio_segments(audio_segments, output_path)
-
-    # タグ付きJSONを保存
-    json_output_path = output_path.with_suffix(".json")
-    save_tagged_json(
-        srt_path,
-        subtitles,
-        tagged_texts,
-        json_output_path,
-        durations_ms=durations_ms if durations_ms else None,
-    )
+        level = logging.WARNING if quiet else logging.INFO
+        handler.setFormatter(logging.Formatter("%(message)s"))
 
-    print(f"完了: {output_path}")
+    # 書式はリスナー側のハンドラーで適用する
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
+    logging.basicConfig(level=level, handlers=[queue_handler])
+    listener = QueueListener(log_queue, handler)
+    listener.start()
+    return listener
 
 
 def main() -> None:
@@ -293,7 +637,12 @@ def main() -> None:
     parser.add_argument(
         "--debug",
         action="store_true",
-        help="デバッグモードを有効にする（LLMコンテキストと応答を詳細出力）",
+        help="デバッグモードを有効にする（LLMコンテキストと応答を詳細出力し、中間音声を.work/に残す）",
+    )
+    parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help="進捗ログを出さず、警告とエラーのみを出力する",
     )
     parser.add_argument(
         "--speed-threshold",
@@ -330,44 +679,31 @@ def main() -> None:
         default="ja",
         help="gTTSの言語コード（デフォルト: ja）。例: en, ja, ko, zh-CN",
     )
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=DEFAULT_MAX_CONCURRENCY,
+        help=f"同時に処理する字幕数の上限（デフォルト: {DEFAULT_MAX_CONCURRENCY}）",
+    )
+    parser.add_argument(
+        "--llm-concurrency",
+        type=int,
+        default=DEFAULT_LLM_CONCURRENCY,
+        help=f"同時に実行するLLMタグ付けリクエスト数の上限（デフォルト: {DEFAULT_LLM_CONCURRENCY}）",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="LLM応答と合成音声のディスクキャッシュを使用しない",
+    )
 
     args = parser.parse_args()
 
-    # デバッグモードでロギングを設定
-    if args.debug:
-        logging.basicConfig(
-            level=logging.DEBUG,
-            format="%(asctime)s [%(name)s] %(levelname)s: %(message)s",
-            datefmt="%H:%M:%S",
-        )
-
-    input_path = Path(args.input)
-    if not input_path.exists():
-        print(f"エラー: ファイルが見つかりません: {input_path}", file=sys.stderr)
-        sys.exit(1)
-
-    if args.output:
-        output_path = Path(args.output)
-    else:
-        suffix = ".json" if args.json_only else ".mp3"
-        output_path = Path("output") / f"{input_path.stem}{suffix}"
-
-    # estimation_ratioが0以下の場合は無効化
-    estimation_ratio = args.estimation_ratio if args.estimation_ratio > 0 else None
-
-    process_srt_file(
-        input_path,
-        output_path,
-        use_audio_tags=not args.no_tags,
-        json_only=args.json_only,
-        gtts_only=args.gtts_only,
-        debug=args.debug,
-        speed_threshold=args.speed_threshold,
-        max_shorten_retries=args.max_shorten_retries,
-        margin_ms=args.margin_ms,
-        estimation_ratio=estimation_ratio,
-        lang=args.lang,
-    )
+    listener = _configure_logging(debug=args.debug, quiet=args.quiet)
+    try:
+        _run(args)
+    finally:
+        listener.stop()
 
 
 if __name__ == "__main__":
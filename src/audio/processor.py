@@ -1,47 +1,99 @@
 """音声処理機能を提供するモジュール"""
 
+import shutil
+import subprocess
 from pathlib import Path
+from typing import BinaryIO
 
 from pydub import AudioSegment
 
+try:
+    from mutagen.mp3 import MP3
+except ImportError:
+    MP3 = None
 
-def get_audio_duration_ms(audio_path: str | Path) -> int:
-    """音声ファイルの長さをミリ秒で取得する"""
-    audio = AudioSegment.from_file(str(audio_path))
+
+def get_audio_duration_ms(audio_path: str | Path | BinaryIO) -> int:
+    """
+    音声ファイルの長さをミリ秒で取得する
+
+    MP3はフレームヘッダーのみを読んで長さを求め、ffmpegでのデコードを避ける。
+    ヘッダーを読めない場合はpydubでデコードして求める。
+    パスの代わりにio.BytesIOなどのファイルオブジェクトも渡せる。
+    """
+    source = audio_path if hasattr(audio_path, "read") else str(audio_path)
+
+    if MP3 is not None:
+        try:
+            return int(MP3(source).info.length * 1000)
+        except Exception:
+            if hasattr(source, "seek"):
+                source.seek(0)
+
+    audio = AudioSegment.from_file(source)
     return len(audio)
 
 
+def _atempo_filter(speed_ratio: float) -> str:
+    """
+    速度比をffmpegのatempoフィルタ列に変換する
+
+    atempoは1段あたり0.5〜2.0倍に制限されるため、範囲外は複数段に分割する。
+    """
+    factors = []
+    while speed_ratio > 2.0:
+        factors.append(2.0)
+        speed_ratio /= 2.0
+    while speed_ratio < 0.5:
+        factors.append(0.5)
+        speed_ratio /= 0.5
+    factors.append(speed_ratio)
+    return ",".join(f"atempo={factor:.6f}" for factor in factors)
+
+
 def adjust_audio_speed(audio_path: str | Path, target_duration_ms: int, output_path: str | Path) -> Path:
     """
     音声の速度を調整して指定時間に収める
 
+    ffmpegのatempoフィルタで音程を保ったまま再生速度を上げる。
+
     Args:
         audio_path: 入力音声ファイルのパス
         target_duration_ms: 目標の長さ（ミリ秒）
-        output_path: 出力ファイルのパス
+        output_path: 出力ファイルのパス（拡張子で形式を決定、.wavなら非圧縮PCM）
 
     Returns:
         出力ファイルのパス
     """
-    audio = AudioSegment.from_file(str(audio_path))
-    current_duration = len(audio)
+    current_duration = get_audio_duration_ms(audio_path)
     output_path = Path(output_path)
+    output_format = output_path.suffix.lstrip(".") or "mp3"
 
     if current_duration <= target_duration_ms:
-        # 既に目標時間内なのでそのままコピー
-        audio.export(str(output_path), format="mp3")
+        # 既に目標時間内なのでそのままコピー（形式が同じなら再エンコードしない）
+        if Path(audio_path).suffix.lower() == output_path.suffix.lower():
+            shutil.copyfile(audio_path, output_path)
+        else:
+            AudioSegment.from_file(str(audio_path)).export(str(output_path), format=output_format)
         return output_path
 
     # 速度調整が必要
     speed_ratio = current_duration / target_duration_ms
 
-    # pydubでは直接速度変更できないため、frame_rateを変更して実現
-    # 速度を上げる = frame_rateを上げてから元のframe_rateでエクスポート
-    new_frame_rate = int(audio.frame_rate * speed_ratio)
-    adjusted = audio._spawn(audio.raw_data, overrides={"frame_rate": new_frame_rate})
-    adjusted = adjusted.set_frame_rate(audio.frame_rate)
-
-    adjusted.export(str(output_path), format="mp3")
+    subprocess.run(
+        [
+            "ffmpeg",
+            "-y",
+            "-loglevel",
+            "error",
+            "-i",
+            str(audio_path),
+            "-filter:a",
+            _atempo_filter(speed_ratio),
+            str(output_path),
+        ],
+        check=True,
+    )
     return output_path
 
 
@@ -72,20 +124,41 @@ def combine_audio_segments(
     # 時間順にソート
     audio_files = sorted(audio_files, key=lambda x: x[0])
 
-    combined = AudioSegment.empty()
-    current_position = 0
+    # AudioSegmentの+=は毎回全体をコピーするため、生PCMのチャンクを集めて最後に1回だけ連結する
+    # 形式は最初の音声に揃える（gTTSとElevenLabsでサンプルレートが異なるため）
+    chunks: list[bytes] = []
+    frame_rate = channels = sample_width = None
+    frame_width = 0
+    current_frames = 0
 
     for start_ms, file_path in audio_files:
-        # 現在位置から開始時間までの無音を追加
-        if start_ms > current_position:
-            silence_duration = start_ms - current_position
-            combined += create_silence(silence_duration)
-            current_position = start_ms
+        audio = AudioSegment.from_file(str(file_path))
+        if frame_rate is None:
+            frame_rate, channels, sample_width = audio.frame_rate, audio.channels, audio.sample_width
+            frame_width = channels * sample_width
+        else:
+            audio = (
+                audio.set_frame_rate(frame_rate)
+                .set_channels(channels)
+                .set_sample_width(sample_width)
+            )
+
+        # 現在位置から開始時間までの無音をフレーム単位で追加
+        start_frames = start_ms * frame_rate // 1000
+        if start_frames > current_frames:
+            chunks.append(b"\x00" * ((start_frames - current_frames) * frame_width))
+            current_frames = start_frames
 
         # 音声を追加
-        audio = AudioSegment.from_file(str(file_path))
-        combined += audio
-        current_position += len(audio)
+        chunks.append(audio.raw_data)
+        current_frames += len(audio.raw_data) // frame_width
+
+    combined = AudioSegment(
+        data=b"".join(chunks),
+        sample_width=sample_width,
+        frame_rate=frame_rate,
+        channels=channels,
+    )
 
     # MP3として出力
     output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -0,0 +1,3 @@
+from .store import CACHE_DIR_NAME, DEFAULT_CACHE_MAX_BYTES, FileCache, make_key
+
+__all__ = ["CACHE_DIR_NAME", "DEFAULT_CACHE_MAX_BYTES", "FileCache", "make_key"]
@@ -0,0 +1,192 @@
+"""ディスクキャッシュ機能を提供するモジュール"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any
+
+# キャッシュの保存先（出力先ディレクトリ内。Dockerではoutput/がマウントされるため再実行時も残る）
+CACHE_DIR_NAME = ".cache"
+
+# 音声キャッシュ1つあたりの容量上限（超えた分は最近使っていないものから削除する）
+DEFAULT_CACHE_MAX_BYTES = 2 * 1024**3
+
+
+def make_key(*parts: str) -> str:
+    """
+    キャッシュキーを生成する
+
+    Args:
+        *parts: キーを構成する文字列
+
+    Returns:
+        SHA256の16進ダイジェスト
+    """
+    return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+
+class FileCache:
+    """キーごとに1ファイルで値を保存するディスクキャッシュ"""
+
+    def __init__(self, root: str | Path, max_bytes: int | None = None):
+        """
+        Args:
+            root: キャッシュのルートディレクトリ
+            max_bytes: 容量上限（バイト）、Noneの場合は上限なし。pruneで適用する
+        """
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        # 用途ごとの取得時のヒット/ミス件数（ログ用）
+        self._stats: dict[str, list[int]] = {}
+        self._stats_lock = threading.Lock()
+
+    def record(self, stat: str, hit: bool) -> None:
+        """
+        ヒット/ミス件数を記録する
+
+        Args:
+            stat: 集計する用途の名前（ログに表示する）
+            hit: ヒットした場合はTrue
+        """
+        with self._stats_lock:
+            counts = self._stats.setdefault(stat, [0, 0])
+            counts[0 if hit else 1] += 1
+
+    def stats(self) -> dict[str, tuple[int, int]]:
+        """
+        用途ごとのヒット/ミス件数を返す
+
+        Returns:
+            用途名から(ヒット件数, ミス件数)への辞書
+        """
+        with self._stats_lock:
+            return {stat: (hits, misses) for stat, (hits, misses) in self._stats.items()}
+
+    def _path(self, key: str, suffix: str) -> Path:
+        """キーに対応するファイルパスを返す"""
+        return self.root / key[:2] / f"{key}{suffix}"
+
+    def _touch(self, path: Path) -> None:
+        """取得したファイルの更新時刻を進め、最近使ったものとして扱う"""
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+    def _write_atomic(self, path: Path, write) -> None:
+        """一時ファイルに書き込んでから置き換える（並列書き込み対策）"""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                write(f)
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+    def get_json(self, key: str, stat: str | None = None) -> Any | None:
+        """
+        JSON値を取得する
+
+        Args:
+            key: キャッシュキー
+            stat: ヒット/ミスを集計する用途の名前（Noneの場合は集計しない）
+
+        Returns:
+            保存された値、存在しない場合はNone
+        """
+        path = self._path(key, ".json")
+        try:
+            value = json.loads(path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, json.JSONDecodeError):
+            if stat:
+                self.record(stat, hit=False)
+            return None
+        if stat:
+            self.record(stat, hit=True)
+        self._touch(path)
+        return value
+
+    def set_json(self, key: str, value: Any) -> None:
+        """
+        JSON値を保存する
+
+        Args:
+            key: キャッシュキー
+            value: JSONシリアライズ可能な値
+        """
+        data = json.dumps(value, ensure_ascii=False).encode("utf-8")
+        self._write_atomic(self._path(key, ".json"), lambda f: f.write(data))
+
+    def get_file(
+        self, key: str, dest: str | Path, suffix: str = ".mp3", stat: str | None = None
+    ) -> bool:
+        """
+        キャッシュ済みファイルを指定パスにコピーする
+
+        Args:
+            key: キャッシュキー
+            dest: コピー先のパス
+            suffix: キャッシュファイルの拡張子
+            stat: ヒット/ミスを集計する用途の名前（Noneの場合は集計しない）
+
+        Returns:
+            キャッシュが存在してコピーした場合はTrue
+        """
+        path = self._path(key, suffix)
+        hit = path.exists()
+        if stat:
+            self.record(stat, hit)
+        if not hit:
+            return False
+        dest = Path(dest)
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(path, dest)
+        self._touch(path)
+        return True
+
+    def put_file(self, key: str, src: str | Path, suffix: str = ".mp3") -> None:
+        """
+        ファイルをキャッシュに保存する
+
+        Args:
+            key: キャッシュキー
+            src: 保存するファイルのパス
+            suffix: キャッシュファイルの拡張子
+        """
+        with open(src, "rb") as source:
+            self._write_atomic(self._path(key, suffix), lambda f: shutil.copyfileobj(source, f))
+
+    def prune(self) -> int:
+        """
+        容量上限を超えている場合、最近使っていないファイルから削除する
+
+        Returns:
+            削除したファイル数
+        """
+        if self.max_bytes is None or not self.root.exists():
+            return 0
+
+        files = []
+        for path in self.root.rglob("*"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            if path.is_file():
+                files.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in files)
+        removed = 0
+        for _, size, path in sorted(files):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+        return removed
@@ -1,27 +1,51 @@
 """gTTSによる音声長見積もりクライアントモジュール"""
 
+import io
 import re
-import tempfile
+import threading
 from pathlib import Path
 
 from gtts import gTTS
 
 from ..audio import get_audio_duration_ms
+from ..cache import FileCache, make_key
 
 
 class GTTSEstimator:
     """gTTSを使用して音声長を見積もるクライアント"""
 
-    # ElevenLabsのオーディオタグを除去するための正規表現
-    AUDIO_TAG_PATTERN = re.compile(r"<[^>]+>")
+    # オーディオタグ（[softly]形式）と山括弧のマークアップを除去するための正規表現
+    AUDIO_TAG_PATTERN = re.compile(r"\[[^\]]+\]|<[^>]+>")
 
-    def __init__(self, estimation_ratio: float = 0.9):
+    # 文字数あたりの音声長を較正する際に実測するサンプル数
+    CALIBRATION_SAMPLES = 5
+
+    # 実測のたびに1文字あたりの音声長や補正係数を更新する際の重み（指数移動平均）
+    CALIBRATION_EWMA_ALPHA = 0.2
+
+    def __init__(self, estimation_ratio: float = 0.9, cache: FileCache | None = None):
         """
         Args:
             estimation_ratio: gTTS音声長に対する補正係数（デフォルト0.9）
                 gTTSの見積もり時間にこの係数を掛けてElevenLabsの時間を推定する
+            cache: gTTS音声と実測音声長のディスクキャッシュ（Noneの場合はキャッシュしない）
         """
         self.estimation_ratio = estimation_ratio
+        self.cache = cache
+        # 実際のTTS音声長から学習した補正係数（未観測の間はNoneでestimation_ratioを使う）
+        self._learned_ratio: float | None = None
+        # 言語ごとの1文字あたりの音声長（ミリ秒、補正係数適用前）
+        self._ms_per_char: dict[str, float] = {}
+        # (テキスト, 言語)ごとの実測音声長（プロセス内メモ、補正係数適用前）
+        self._duration_memo: dict[tuple[str, str], int] = {}
+        # 上の3つは並列ワーカーから更新されるため、読み書きはこのロックを保持して行う
+        self._state_lock = threading.Lock()
+
+    def _current_ratio(self) -> float:
+        """予測と見積もりに使う補正係数（_state_lockを保持して呼ぶ）"""
+        if self._learned_ratio is not None:
+            return self._learned_ratio
+        return self.estimation_ratio
 
     def _strip_audio_tags(self, text: str) -> str:
         """
@@ -33,6 +57,9 @@ class GTTSEstimator:
         Returns:
             タグが除去されたプレーンテキスト
         """
+        # タグを含まないテキストでは正規表現の走査を省く
+        if "[" not in text and "<" not in text:
+            return text.strip()
         return self.AUDIO_TAG_PATTERN.sub("", text).strip()
 
     def estimate_duration_ms(self, text: str, lang: str = "ja") -> int:
@@ -52,25 +79,140 @@ class GTTSEstimator:
         if not plain_text:
             return 0
 
-        # 一時ファイルに音声を生成
-        with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as f:
-            temp_path = Path(f.name)
+        # 補正係数を適用
+        raw_ms = self._raw_duration_ms(plain_text, lang)
+        with self._state_lock:
+            ratio = self._current_ratio()
+        return int(raw_ms * ratio)
 
-        try:
-            tts = gTTS(text=plain_text, lang=lang)
-            tts.save(str(temp_path))
+    def _raw_duration_ms(self, plain_text: str, lang: str) -> int:
+        """
+        gTTSで音声を生成して実測の音声長を返す
 
-            # 音声長を取得
-            raw_duration = get_audio_duration_ms(temp_path)
+        Args:
+            plain_text: タグ除去済みのテキスト
+            lang: 言語コード
 
-            # 補正係数を適用
-            estimated_duration = int(raw_duration * self.estimation_ratio)
+        Returns:
+            音声長（ミリ秒）、補正係数適用前
+        """
+        # 同じテキストの実測値はプロセス内メモ、次いでディスクキャッシュから再利用する
+        memo_key = (plain_text, lang)
+        with self._state_lock:
+            duration_ms = self._duration_memo.get(memo_key)
+        if duration_ms is not None:
+            return duration_ms
+
+        key = make_key("gtts_duration", lang, plain_text)
+        if self.cache:
+            duration_ms = self.cache.get_json(key, stat="gTTS音声長")
+
+        if duration_ms is None:
+            duration_ms = self._measure_duration_ms(plain_text, lang)
+            if self.cache:
+                self.cache.set_json(key, duration_ms)
+
+        with self._state_lock:
+            self._duration_memo[memo_key] = duration_ms
+            self._update_ms_per_char(plain_text, duration_ms, lang)
+        return duration_ms
+
+    def _update_ms_per_char(self, plain_text: str, duration_ms: int, lang: str) -> None:
+        """
+        実測値で較正済みの1文字あたりの音声長を更新する（未較正の言語は何もしない）
 
-            return estimated_duration
-        finally:
-            # 一時ファイルを削除
-            if temp_path.exists():
-                temp_path.unlink()
+        読み出しと書き込みを不可分にするため、_state_lockを保持して呼ぶ。
+
+        Args:
+            plain_text: タグ除去済みのテキスト
+            duration_ms: 実測の音声長（ミリ秒、補正係数適用前）
+            lang: 言語コード
+        """
+        ms_per_char = self._ms_per_char.get(lang)
+        if ms_per_char is None:
+            return
+        alpha = self.CALIBRATION_EWMA_ALPHA
+        sample = duration_ms / len(plain_text)
+        self._ms_per_char[lang] = alpha * sample + (1 - alpha) * ms_per_char
+
+    def _measure_duration_ms(self, plain_text: str, lang: str) -> int:
+        """gTTSで音声を生成して音声長を実測する"""
+        # 一時ファイルを作らずメモリ上に音声を生成
+        buffer = io.BytesIO()
+        tts = gTTS(text=plain_text, lang=lang)
+        tts.write_to_fp(buffer)
+        buffer.seek(0)
+
+        # 音声長を取得
+        return get_audio_duration_ms(buffer)
+
+    def calibrate(self, texts: list[str], lang: str = "ja") -> float | None:
+        """
+        サンプルテキストを実測して1文字あたりの音声長を較正する
+
+        Args:
+            texts: 較正に使うテキストのリスト（均等に間引いて使用）
+            lang: 言語コード
+
+        Returns:
+            1文字あたりの音声長（ミリ秒）、サンプルがない場合はNone
+        """
+        plain_texts = [plain for plain in (self._strip_audio_tags(t) for t in texts) if plain]
+        if not plain_texts:
+            return None
+
+        step = max(1, len(plain_texts) // self.CALIBRATION_SAMPLES)
+        samples = plain_texts[::step][: self.CALIBRATION_SAMPLES]
+
+        total_ms = sum(self._raw_duration_ms(plain, lang) for plain in samples)
+        total_chars = sum(len(plain) for plain in samples)
+        ms_per_char = total_ms / total_chars
+        with self._state_lock:
+            self._ms_per_char[lang] = ms_per_char
+        return ms_per_char
+
+    def predict_duration_ms(self, text: str, lang: str = "ja") -> int | None:
+        """
+        較正済みの文字数モデルで音声長を予測する（ネットワーク通信なし）
+
+        Args:
+            text: 予測対象のテキスト（オーディオタグ含む可）
+            lang: 言語コード
+
+        Returns:
+            予測音声長（ミリ秒）、補正係数適用済み。未較正の場合はNone
+        """
+        with self._state_lock:
+            ms_per_char = self._ms_per_char.get(lang)
+            ratio = self._current_ratio()
+        if ms_per_char is None:
+            return None
+        return int(len(self._strip_audio_tags(text)) * ms_per_char * ratio)
+
+    def observe_tts_duration(self, text: str, duration_ms: int, lang: str = "ja") -> None:
+        """
+        実際のTTS音声長を取り込み、学習済みの補正係数を指数移動平均で更新する
+
+        文字数モデルの予測（補正係数適用前）と実際の音声長の比を観測値とし、
+        以降の予測と見積もりをTTSの実際の話速に近づける。ユーザー指定の
+        estimation_ratioは初期値としてのみ使い、上書きしない。
+        文字数にはオーディオタグを含めない。未較正の言語は何もしない。
+
+        Args:
+            text: TTSに渡したテキスト（オーディオタグ含む可）
+            duration_ms: 実際のTTS音声長（ミリ秒）
+            lang: 言語コード
+        """
+        plain_text = self._strip_audio_tags(text)
+        if not plain_text or duration_ms <= 0:
+            return
+        alpha = self.CALIBRATION_EWMA_ALPHA
+        with self._state_lock:
+            ms_per_char = self._ms_per_char.get(lang)
+            if ms_per_char is None:
+                return
+            sample = duration_ms / (len(plain_text) * ms_per_char)
+            self._learned_ratio = alpha * sample + (1 - alpha) * self._current_ratio()
 
     def will_fit_in_duration(self, text: str, available_ms: int, lang: str = "ja") -> bool:
         """
@@ -87,7 +229,9 @@ class GTTSEstimator:
         estimated = self.estimate_duration_ms(text, lang)
         return estimated <= available_ms
 
-    def synthesize(self, text: str, output_path: str | Path, lang: str = "ja") -> tuple[Path, int]:
+    def synthesize(
+        self, text: str, output_path: str | Path, lang: str = "ja"
+    ) -> tuple[Path | None, int]:
         """
         gTTSでテキストを音声に変換してファイルに保存する
 
@@ -97,7 +241,8 @@ class GTTSEstimator:
             lang: 言語コード（デフォルト: ja）
 
         Returns:
-            (保存されたファイルのパス, 音声長ミリ秒)のタプル
+            (保存されたファイルのパス, 音声長ミリ秒)のタプル。
+            タグを除くと読み上げる文字がない場合は(None, 0)
         """
         output_path = Path(output_path)
 
@@ -105,10 +250,13 @@ class GTTSEstimator:
         plain_text = self._strip_audio_tags(text)
 
         if not plain_text:
-            # 空のテキストの場合は空のファイルを作成
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            output_path.touch()
-            return (output_path, 0)
+            # 「[Music]」のようにタグだけの字幕は無音として扱い、ファイルを作らない
+            return (None, 0)
+
+        # キャッシュ済みならgTTSを呼ばずに復元
+        key = make_key("gtts", lang, plain_text)
+        if self.cache and self.cache.get_file(key, output_path, stat="gTTS音声"):
+            return (output_path, get_audio_duration_ms(output_path))
 
         # 音声を生成
         tts = gTTS(text=plain_text, lang=lang)
@@ -118,4 +266,10 @@ class GTTSEstimator:
         # 音声長を取得
         duration_ms = get_audio_duration_ms(output_path)
 
+        with self._state_lock:
+            self._duration_memo[(plain_text, lang)] = duration_ms
+        if self.cache:
+            self.cache.put_file(key, output_path)
+            self.cache.set_json(make_key("gtts_duration", lang, plain_text), duration_ms)
+
         return (output_path, duration_ms)
@@ -2,15 +2,22 @@
 
 import json
 import os
+from collections.abc import Callable
 from typing import Any
 
-import requests
+from ..cache import FileCache, make_key
+from .session import create_session
 
 
 class LLMClient:
     """OpenAI互換LLM APIクライアント"""
 
-    def __init__(self):
+    def __init__(self, cache: FileCache | None = None):
+        """
+        Args:
+            cache: JSON応答のディスクキャッシュ（Noneの場合はキャッシュしない）
+        """
+        self.cache = cache
         self.api_key = os.getenv("LLM_API_KEY")
         self.base_url = os.getenv("LLM_BASE_URL", "https://api.openai.com/v1")
         self.model = os.getenv("LLM_MODEL", "gpt-4o-mini")
@@ -18,6 +25,24 @@ class LLMClient:
         if not self.api_key:
             raise ValueError("LLM_API_KEY環境変数が設定されていません")
 
+        # 接続を使い回してリクエストごとのTCP/TLSハンドシェイクを避ける
+        self._session = create_session(
+            {
+                "Authorization": f"Bearer {self.api_key}",
+                "Content-Type": "application/json",
+            }
+        )
+
+    def close(self) -> None:
+        """HTTPセッションを閉じる"""
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
     def chat(
         self,
         messages: list[dict[str, str]],
@@ -35,11 +60,6 @@ class LLMClient:
         """
         url = f"{self.base_url.rstrip('/')}/chat/completions"
 
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-        }
-
         payload: dict[str, Any] = {
             "model": self.model,
             "messages": messages,
@@ -48,21 +68,54 @@ class LLMClient:
         if json_mode:
             payload["response_format"] = {"type": "json_object"}
 
-        response = requests.post(url, json=payload, headers=headers, timeout=120)
+        response = self._session.post(url, json=payload, timeout=120)
         response.raise_for_status()
 
         data = response.json()
         return data["choices"][0]["message"]["content"]
 
-    def chat_json(self, messages: list[dict[str, str]]) -> dict:
+    def chat_json(
+        self,
+        messages: list[dict[str, str]],
+        validate: Callable[[dict], None] | None = None,
+    ) -> dict:
         """
         チャットAPIをJSONモードで呼び出し、パース済みの辞書を返す
 
         Args:
             messages: メッセージのリスト
+            validate: 応答を検証する関数（不正な場合はValueErrorを送出する）。
+                検証に通った応答だけをキャッシュし、不正なキャッシュは使わない
 
         Returns:
             パース済みのJSON辞書
+
+        Raises:
+            ValueError: validateが応答を不正と判定した場合
         """
+        # モデルとメッセージが完全に一致する呼び出しは前回の応答を再利用する
+        key = None
+        if self.cache:
+            key = make_key(
+                "chat_json",
+                self.model,
+                json.dumps(messages, ensure_ascii=False, sort_keys=True),
+            )
+            cached = self.cache.get_json(key, stat="LLM")
+            if cached is not None:
+                try:
+                    if validate:
+                        validate(cached)
+                    return cached
+                except ValueError:
+                    # 以前保存された不正な応答は捨てて取り直す
+                    pass
+
         content = self.chat(messages, json_mode=True)
-        return json.loads(content)
+        result = json.loads(content)
+        if validate:
+            validate(result)
+
+        if key:
+            self.cache.set_json(key, result)
+        return result
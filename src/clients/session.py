@@ -0,0 +1,36 @@
+"""APIクライアント共通のHTTPセッション生成モジュール"""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# 接続プールの大きさ（同時リクエスト数の上限より大きくしておく）
+POOL_SIZE = 16
+
+
+def create_session(headers: dict[str, str]) -> requests.Session:
+    """
+    接続プールとリトライを設定したHTTPセッションを生成する
+
+    Args:
+        headers: 全リクエストに付与するヘッダー
+
+    Returns:
+        設定済みのセッション
+    """
+    session = requests.Session()
+    session.headers.update(headers)
+
+    # レート制限・一時的なサーバーエラーはバックオフして再送する
+    retry = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=["POST"],
+        # 再送し尽くした場合も最後の応答を返し、呼び出し側のraise_for_statusに任せる
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
@@ -3,7 +3,10 @@
 import os
 from pathlib import Path
 
-import requests
+from .session import create_session
+
+# 音声をファイルへ書き込む際のチャンクサイズ（バイト）
+STREAM_CHUNK_SIZE = 64 * 1024
 
 
 class TTSClient:
@@ -20,6 +23,24 @@ class TTSClient:
         if not self.voice_id:
             raise ValueError("TTS_VOICE_ID環境変数が設定されていません")
 
+        # 接続を使い回してリクエストごとのTCP/TLSハンドシェイクを避ける
+        self._session = create_session(
+            {
+                "xi-api-key": self.api_key,
+                "Content-Type": "application/json",
+            }
+        )
+
+    def close(self) -> None:
+        """HTTPセッションを閉じる"""
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
     def synthesize(self, text: str, output_path: str | Path) -> Path:
         """
         テキストを音声に変換してファイルに保存する
@@ -34,11 +55,6 @@ class TTSClient:
         output_path = Path(output_path)
         url = f"{self.base_url.rstrip('/')}/text-to-speech/{self.voice_id}"
 
-        headers = {
-            "xi-api-key": self.api_key,
-            "Content-Type": "application/json",
-        }
-
         payload = {
             "text": text,
             "model_id": self.model,
@@ -48,10 +64,13 @@ class TTSClient:
             },
         }
 
-        response = requests.post(url, json=payload, headers=headers, timeout=60)
-        response.raise_for_status()
+        # 応答全体をメモリに載せず、受信したチャンクから順にファイルへ書き込む
+        with self._session.post(url, json=payload, timeout=60, stream=True) as response:
+            response.raise_for_status()
 
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_bytes(response.content)
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(output_path, "wb") as f:
+                for chunk in response.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+                    f.write(chunk)
 
         return output_path
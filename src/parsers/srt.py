@@ -1,10 +1,21 @@
 """SRTファイルのパース機能を提供するモジュール"""
 
+import re
 from dataclasses import dataclass
 from pathlib import Path
 
 import pysrt
 
+# 1エントリー分のブロック（番号・時刻行・本文）にマッチする正規表現
+_BLOCK_PATTERN = re.compile(
+    r"(\d+)\n"
+    r"(\d+):(\d\d):(\d\d)[,.](\d{3}) --> (\d+):(\d\d):(\d\d)[,.](\d{3})[^\n]*\n"
+    r"(.+)",
+    re.DOTALL,
+)
+# エントリー間の空行（連続する空行もまとめて区切りとみなす）
+_BLOCK_SEPARATOR = re.compile(r"\n(?:[ \t]*\n)+")
+
 
 @dataclass
 class Subtitle:
@@ -26,16 +37,54 @@ def _time_to_ms(time: pysrt.SubRipTime) -> int:
     return (time.hours * 3600 + time.minutes * 60 + time.seconds) * 1000 + time.milliseconds
 
 
+def _parse_blocks(content: str) -> list[Subtitle] | None:
+    """
+    標準的なSRTを正規表現で直接パースする
+
+    Args:
+        content: SRTファイルの内容
+
+    Returns:
+        字幕データのリスト、想定外の形式を含む場合はNone
+    """
+    content = content.lstrip("\ufeff").replace("\r\n", "\n").replace("\r", "\n").strip()
+    if not content:
+        return []
+
+    subtitles = []
+    for block in _BLOCK_SEPARATOR.split(content):
+        match = _BLOCK_PATTERN.fullmatch(block.strip())
+        if not match:
+            return None
+        index, sh, sm, ss, sms, eh, em, es, ems, text = match.groups()
+        subtitles.append(
+            Subtitle(
+                index=int(index),
+                start_ms=((int(sh) * 60 + int(sm)) * 60 + int(ss)) * 1000 + int(sms),
+                end_ms=((int(eh) * 60 + int(em)) * 60 + int(es)) * 1000 + int(ems),
+                # pysrtと同様に各行の末尾の空白を除いてから連結する
+                text=" ".join(line.rstrip() for line in text.split("\n")),
+            )
+        )
+    return subtitles
+
+
 def parse_srt(file_path: str | Path) -> list[Subtitle]:
     """
     SRTファイルをパースして字幕リストを返す
 
+    標準的な形式は正規表現で直接パースし、それ以外はpysrtで読む。
+
     Args:
         file_path: SRTファイルのパス
 
     Returns:
         字幕データのリスト
     """
+    subtitles = _parse_blocks(Path(file_path).read_text(encoding="utf-8"))
+    if subtitles is not None:
+        return subtitles
+
     subs = pysrt.open(str(file_path), encoding="utf-8")
 
     return [
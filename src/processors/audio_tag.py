@@ -1,21 +1,97 @@
 """オーディオタグ付与機能を提供するモジュール"""
 
+import json
 import logging
+import threading
+from collections import OrderedDict
 
+from ..cache import make_key
 from ..clients import LLMClient
 from ..prompts import load_prompt
 
 logger = logging.getLogger(__name__)
 
+# プロセス内に保持するタグ付け結果の上限件数
+TAG_MEMO_SIZE = 256
+
+# 前後それぞれのコンテキストとして送る最大文字数（対象から遠いエントリーから削る）
+CONTEXT_CHAR_BUDGET = 400
+
+
+def _dump_request(payload) -> str:
+    """
+    LLMに送る可変部分をJSON文字列にする
+
+    プロバイダーのプロンプトキャッシュは先頭一致で効くため、
+    キーの順序と空白を常に同じにする。
+
+    Args:
+        payload: 送信するデータ
+
+    Returns:
+        JSON文字列
+    """
+    return json.dumps(payload, ensure_ascii=False, indent=2)
+
+
+def _trim_context(texts: list[str] | None, from_end: bool = False) -> list[str]:
+    """
+    コンテキストを対象に近いエントリーから順にCONTEXT_CHAR_BUDGET文字まで残す
+
+    Args:
+        texts: コンテキストのテキストリスト
+        from_end: 末尾が対象に近い（前のエントリー）場合はTrue
+
+    Returns:
+        上限内に収まるテキストのリスト（元の順序を保つ）
+    """
+    ordered = list(reversed(texts or [])) if from_end else list(texts or [])
+    kept = []
+    budget = CONTEXT_CHAR_BUDGET
+    for text in ordered:
+        budget -= len(text)
+        if budget < 0:
+            break
+        kept.append(text)
+    return kept[::-1] if from_end else kept
+
 
 class AudioTagProcessor:
     """LLMを使用してテキストにオーディオタグを付与するプロセッサ"""
 
     def __init__(self, llm_client: LLMClient, debug: bool = False):
+        """
+        Args:
+            llm_client: LLMクライアント（ディスクキャッシュはクライアント側で行う）
+            debug: デバッグログを出力するか
+        """
         self.llm_client = llm_client
         self.debug = debug
         self.system_prompt = load_prompt("audio_tag_system")
         self.shorten_prompt = load_prompt("shorten_text_system")
+        self.input_format_prompt = load_prompt("audio_tag_input_format")
+        self.shorten_input_format_prompt = load_prompt("shorten_text_input_format")
+        self.batch_format_prompt = load_prompt("audio_tag_batch_format")
+        # 同一入力のタグ付け結果（プロセス内メモ、最近使った順のLRU）
+        self._tag_memo: OrderedDict[str, str] = OrderedDict()
+        self._memo_lock = threading.Lock()
+
+    def config_key(self) -> str:
+        """
+        タグ付けと短縮の結果を左右する設定（モデルと全プロンプト）のキーを返す
+
+        Returns:
+            make_keyによるキー。プロンプトを編集すると変わる
+        """
+        return make_key(
+            "audio_tag_config",
+            self.llm_client.model,
+            self.system_prompt,
+            self.shorten_prompt,
+            self.input_format_prompt,
+            self.shorten_input_format_prompt,
+            self.batch_format_prompt,
+        )
 
     def add_tags(
         self,
@@ -27,6 +103,10 @@ class AudioTagProcessor:
         """
         テキストにオーディオタグを付与する
 
+        メッセージは「システムプロンプト → 入力形式の説明 → 可変部分のJSON」の
+        順に固定している。先頭2つは全呼び出しで同一なので、プロバイダーの
+        プロンプトキャッシュが効く。順序やJSONのキー順を変えるとキャッシュが外れる。
+
         Args:
             text: 元のテキスト（タグ付与対象）
             prev_texts: 前のエントリーのテキストリスト（最大2つ）
@@ -36,25 +116,8 @@ class AudioTagProcessor:
         Returns:
             オーディオタグが付与されたテキスト
         """
-        # コンテキストを構築
-        context_parts = []
-
-        if prev_texts:
-            context_parts.append("## Previous entries (for context only):")
-            for i, prev_text in enumerate(prev_texts, 1):
-                context_parts.append(f"[-{len(prev_texts) - i + 1}] {prev_text}")
-            context_parts.append("")
-
-        context_parts.append("## TARGET text (add tags to this):")
-        context_parts.append(text)
-        context_parts.append("")
-
-        if next_texts:
-            context_parts.append("## Next entries (for context only):")
-            for i, next_text in enumerate(next_texts, 1):
-                context_parts.append(f"[+{i}] {next_text}")
-
-        user_content = "\n".join(context_parts)
+        # 可変部分だけをユーザーメッセージに入れる
+        user_content = _dump_request(self._tag_request(text, prev_texts, next_texts))
 
         # デバッグログ: LLMに送信するコンテキスト
         if self.debug:
@@ -66,13 +129,24 @@ class AudioTagProcessor:
             if next_texts:
                 logger.debug(f"次のコンテキスト: {next_texts}")
 
+        # 同一プロンプト・同一入力ならプロセス内の結果を再利用
+        key = self._memo_key(user_content)
+        tagged_text = self._memo_get(key)
+        if tagged_text is not None:
+            if self.debug:
+                logger.debug(f"タグ付き結果（キャッシュ）: {tagged_text}")
+                logger.debug("=" * 50)
+            return tagged_text
+
         messages = [
             {"role": "system", "content": self.system_prompt},
+            {"role": "system", "content": self.input_format_prompt},
             {"role": "user", "content": user_content},
         ]
 
         result = self.llm_client.chat_json(messages)
         tagged_text = result.get("tagged_text", text)
+        self._memo_put(key, tagged_text)
 
         # デバッグログ: LLMからの応答
         if self.debug:
@@ -81,6 +155,128 @@ class AudioTagProcessor:
 
         return tagged_text
 
+    def batch_add_tags(self, items: list[dict]) -> list[str]:
+        """
+        複数のテキストに1回のリクエストでオーディオタグを付与する
+
+        システムプロンプトは単体版と共通にし、バッチ用の出力形式は
+        2つ目のシステムメッセージで指定する。結果は単体版と同じキーで
+        プロセス内メモに保存し、メモにある項目やバッチ内で重複する項目は送らない。
+
+        Args:
+            items: {"prev_texts", "text", "next_texts"}を持つ辞書のリスト
+
+        Returns:
+            itemsと同じ順序のタグ付きテキストのリスト
+
+        Raises:
+            ValueError: 応答の件数や形式が入力と一致しない場合
+        """
+        requests = [
+            self._tag_request(item["text"], item.get("prev_texts"), item.get("next_texts"))
+            for item in items
+        ]
+        keys = [self._memo_key(_dump_request(request)) for request in requests]
+        tagged_texts = [self._memo_get(key) for key in keys]
+
+        # メモにない項目を、同一の(前, 対象, 次)は1件にまとめて送る
+        pending: dict[str, dict] = {}
+        for key, request, tagged_text in zip(keys, requests, tagged_texts):
+            if tagged_text is None and key not in pending:
+                pending[key] = request
+        if pending:
+            results = self._request_batch(list(pending.values()))
+            for key, tagged_text in zip(pending, results):
+                self._memo_put(key, tagged_text)
+            resolved = dict(zip(pending, results))
+            tagged_texts = [
+                tagged_text if tagged_text is not None else resolved[key]
+                for key, tagged_text in zip(keys, tagged_texts)
+            ]
+
+        if self.debug:
+            for item, tagged_text in zip(items, tagged_texts):
+                logger.debug(f"{item['text']} -> {tagged_text}")
+            logger.debug("=" * 50)
+
+        return tagged_texts
+
+    def _request_batch(self, payload: list[dict]) -> list[str]:
+        """
+        バッチ用のメッセージでLLMにタグ付けを依頼する
+
+        Args:
+            payload: _tag_requestで構築したリクエストのリスト
+
+        Returns:
+            payloadと同じ順序のタグ付きテキストのリスト
+
+        Raises:
+            ValueError: 応答の件数や形式が入力と一致しない場合
+        """
+        user_content = _dump_request(payload)
+
+        if self.debug:
+            logger.debug(f"=== バッチタグ付与リクエスト ({len(payload)}件) ===")
+            logger.debug(user_content)
+
+        messages = [
+            {"role": "system", "content": self.system_prompt},
+            {"role": "system", "content": self.batch_format_prompt},
+            {"role": "user", "content": user_content},
+        ]
+
+        def validate(result: dict) -> None:
+            tagged_texts = result.get("tagged_texts")
+            if not isinstance(tagged_texts, list) or len(tagged_texts) != len(payload):
+                raise ValueError(
+                    f"バッチ応答の件数が一致しません（期待: {len(payload)}件）: {tagged_texts!r}"
+                )
+            if not all(isinstance(t, str) for t in tagged_texts):
+                raise ValueError(f"バッチ応答に文字列以外が含まれています: {tagged_texts!r}")
+
+        # 検証してからキャッシュさせ、不正な応答が再実行時に再利用されないようにする
+        result = self.llm_client.chat_json(messages, validate=validate)
+        return result["tagged_texts"]
+
+    def _tag_request(
+        self,
+        text: str,
+        prev_texts: list[str] | None,
+        next_texts: list[str] | None,
+    ) -> dict:
+        """タグ付けリクエストの可変部分を構築する（キー順はプロンプトキャッシュのため固定）"""
+        return {
+            "prev_texts": _trim_context(prev_texts, from_end=True),
+            "target": text,
+            "next_texts": _trim_context(next_texts),
+        }
+
+    def _memo_key(self, user_content: str) -> str:
+        """タグ付け結果のプロセス内メモのキーを作る"""
+        return make_key(
+            "add_tags",
+            self.llm_client.model,
+            self.system_prompt,
+            self.input_format_prompt,
+            user_content,
+        )
+
+    def _memo_get(self, key: str) -> str | None:
+        """プロセス内メモからタグ付け結果を取り出す（なければNone）"""
+        with self._memo_lock:
+            tagged_text = self._tag_memo.get(key)
+            if tagged_text is not None:
+                self._tag_memo.move_to_end(key)
+        return tagged_text
+
+    def _memo_put(self, key: str, tagged_text: str) -> None:
+        """タグ付け結果をプロセス内メモに保存する（上限を超えたら古いものから捨てる）"""
+        with self._memo_lock:
+            self._tag_memo[key] = tagged_text
+            if len(self._tag_memo) > TAG_MEMO_SIZE:
+                self._tag_memo.popitem(last=False)
+
     def shorten_text(
         self,
         text: str,
@@ -88,45 +284,72 @@ class AudioTagProcessor:
         prev_texts: list[str] | None = None,
         next_texts: list[str] | None = None,
         entry_index: int | None = None,
+        previous_attempt: dict | None = None,
     ) -> str:
         """
         テキストを指定比率に短縮し、オーディオタグも付与する
 
+        previous_attemptを渡すと、前回の短縮依頼とその応答を会話として再現し、
+        実際の音声長を伝えたうえで前回の出力をさらに短縮させる。
+
         Args:
             text: 元のテキスト（短縮対象）
             target_ratio: 目標短縮率（0.7 = 70%に短縮）
             prev_texts: 前のエントリーのテキストリスト（最大2つ）
             next_texts: 次のエントリーのテキストリスト（最大2つ）
             entry_index: エントリーのインデックス（ログ用）
+            previous_attempt: 前回の短縮結果。text, target_ratio, shortened_text
+                （今回のtextと同じ）, duration_ms, available_msを持つ辞書
 
         Returns:
             短縮されたテキスト（オーディオタグ付き）
         """
-        # コンテキストを構築
-        context_parts = []
-
-        context_parts.append(f"## Target Ratio: {target_ratio:.0%}")
-        context_parts.append(
-            f"(Shorten to approximately {target_ratio:.0%} of original length)"
-        )
-        context_parts.append("")
+        prev_context = _trim_context(prev_texts, from_end=True)
+        next_context = _trim_context(next_texts)
 
-        if prev_texts:
-            context_parts.append("## Previous entries (for context only):")
-            for i, prev_text in enumerate(prev_texts, 1):
-                context_parts.append(f"[-{len(prev_texts) - i + 1}] {prev_text}")
-            context_parts.append("")
-
-        context_parts.append("## TARGET text (shorten this):")
-        context_parts.append(text)
-        context_parts.append("")
-
-        if next_texts:
-            context_parts.append("## Next entries (for context only):")
-            for i, next_text in enumerate(next_texts, 1):
-                context_parts.append(f"[+{i}] {next_text}")
-
-        user_content = "\n".join(context_parts)
+        # 可変部分だけをユーザーメッセージに入れる
+        if previous_attempt:
+            conversation = [
+                {
+                    "role": "user",
+                    "content": _dump_request(
+                        {
+                            "target_ratio": round(previous_attempt["target_ratio"], 2),
+                            "prev_texts": prev_context,
+                            "target": previous_attempt["text"],
+                            "next_texts": next_context,
+                        }
+                    ),
+                },
+                {
+                    "role": "assistant",
+                    "content": _dump_request({"shortened_text": previous_attempt["shortened_text"]}),
+                },
+                {
+                    "role": "user",
+                    "content": _dump_request(
+                        {
+                            "previous_duration_ms": previous_attempt["duration_ms"],
+                            "available_ms": previous_attempt["available_ms"],
+                            "target_ratio": round(target_ratio, 2),
+                        }
+                    ),
+                },
+            ]
+        else:
+            conversation = [
+                {
+                    "role": "user",
+                    "content": _dump_request(
+                        {
+                            "target_ratio": round(target_ratio, 2),
+                            "prev_texts": prev_context,
+                            "target": text,
+                            "next_texts": next_context,
+                        }
+                    ),
+                },
+            ]
 
         # デバッグログ: LLMに送信するコンテキスト
         if self.debug:
@@ -134,6 +357,10 @@ class AudioTagProcessor:
             logger.debug(f"=== 短縮リクエスト {index_str} ===")
             logger.debug(f"対象テキスト: {text}")
             logger.debug(f"目標比率: {target_ratio:.0%}")
+            if previous_attempt:
+                logger.debug(
+                    f"前回の結果: {previous_attempt['duration_ms']}ms > {previous_attempt['available_ms']}ms"
+                )
             if prev_texts:
                 logger.debug(f"前のコンテキスト: {prev_texts}")
             if next_texts:
@@ -141,7 +368,8 @@ class AudioTagProcessor:
 
         messages = [
             {"role": "system", "content": self.shorten_prompt},
-            {"role": "user", "content": user_content},
+            {"role": "system", "content": self.shorten_input_format_prompt},
+            *conversation,
         ]
 
         result = self.llm_client.chat_json(messages)
@@ -1,13 +1,38 @@
 """字幕処理と音声生成を担当するモジュール"""
 
-import traceback
+import logging
+import threading
+from dataclasses import dataclass
 from pathlib import Path
 
 from ..audio import adjust_audio_speed, get_audio_duration_ms
+from ..cache import FileCache, make_key
 from ..clients import GTTSEstimator, TTSClient
 from ..parsers import Subtitle
 from .audio_tag import AudioTagProcessor
 
+logger = logging.getLogger(__name__)
+
+# 文字数モデルの予測がこの割合以下ならgTTSでの実測を省略する
+PREDICTION_SAFETY_RATIO = 0.8
+# 文字数モデルの予測が利用可能時間をこれ以上超えるなら、実測せず予測値で短縮に進む
+PREDICTION_OVERRUN_MS = 200
+
+
+@dataclass
+class SynthesizedEntry:
+    """TTSまで完了し、速度調整を待つ字幕音声"""
+
+    subtitle: Subtitle
+    start_ms: int
+    audio_path: Path | None
+    text: str
+    # 速度調整が必要な場合の目標長と現在の長さ（ミリ秒）
+    target_duration_ms: int | None = None
+    audio_duration_ms: int | None = None
+    # 結果をキャッシュに保存する際のキー
+    cache_key: str | None = None
+
 
 class SubtitleProcessor:
     """字幕を処理して音声ファイルを生成するプロセッサ"""
@@ -21,6 +46,7 @@ class SubtitleProcessor:
         margin_ms: int = 100,
         gtts_estimator: GTTSEstimator | None = None,
         lang: str = "ja",
+        audio_cache: FileCache | None = None,
     ):
         """
         Args:
@@ -31,6 +57,7 @@ class SubtitleProcessor:
             margin_ms: エントリー間の最低マージン（ミリ秒）
             gtts_estimator: gTTSによる事前見積もりクライアント（Noneの場合はスキップ）
             lang: gTTSの言語コード（デフォルト: ja）
+            audio_cache: 合成音声のディスクキャッシュ（Noneの場合はキャッシュしない）
         """
         self.tts_client = tts_client
         self.audio_tag_processor = audio_tag_processor
@@ -39,6 +66,139 @@ class SubtitleProcessor:
         self.margin_ms = margin_ms
         self.gtts_estimator = gtts_estimator
         self.lang = lang
+        self.audio_cache = audio_cache
+        # 同一テキストのTTSを1回にまとめるための、生成済みキーとキーごとのロック
+        self._synthesized: set[str] = set()
+        self._synth_locks: dict[str, threading.Lock] = {}
+        self._synth_locks_lock = threading.Lock()
+
+    def tag(
+        self,
+        subtitle: Subtitle,
+        prev_texts: list[str] | None = None,
+        next_texts: list[str] | None = None,
+    ) -> str:
+        """
+        字幕テキストにオーディオタグを付与する
+
+        タグ付けに失敗した場合やプロセッサがない場合は元のテキストを返す。
+
+        Args:
+            subtitle: 字幕データ
+            prev_texts: 前のエントリーのテキストリスト
+            next_texts: 次のエントリーのテキストリスト
+
+        Returns:
+            タグ付きテキスト
+        """
+        text = subtitle.text
+        if not self.audio_tag_processor:
+            return text
+
+        try:
+            tagged_text = self.audio_tag_processor.add_tags(
+                text,
+                prev_texts=prev_texts,
+                next_texts=next_texts,
+                entry_index=subtitle.index,
+            )
+            logger.debug(f"    [{subtitle.index}] [タグ付与成功]")
+            logger.debug(f"    [{subtitle.index}] 元テキスト: {text}")
+            logger.debug(f"    [{subtitle.index}] タグ付き: {tagged_text}")
+            return tagged_text
+        except Exception as e:
+            logger.exception(f"    [{subtitle.index}] [タグ付与エラー] {e}")
+            return text
+
+    def tag_batch(
+        self,
+        subtitles: list[Subtitle],
+        contexts: list[dict],
+    ) -> list[str | None]:
+        """
+        複数の字幕テキストに1回のLLMリクエストでオーディオタグを付与する
+
+        文字数モデルで事前短縮が確実な字幕はタグ付けを保留し、Noneを返す。
+        短縮プロンプトがタグも付与するため、短縮と合わせて1回のLLM呼び出しで済む。
+        保留した字幕はsynthesizeにtagging_deferred=Trueで渡すこと。
+        バッチ応答が壊れている場合は1件ずつのタグ付けにフォールバックする。
+
+        Args:
+            subtitles: 字幕データのリスト
+            contexts: _build_contextsで構築した各字幕のコンテキスト
+
+        Returns:
+            字幕と同じ順序のタグ付きテキストのリスト（タグ付けを保留した字幕はNone）
+        """
+        tagged_texts: list[str | None] = [subtitle.text for subtitle in subtitles]
+        if not self.audio_tag_processor:
+            return tagged_texts
+
+        pending = []
+        for i, (subtitle, context) in enumerate(zip(subtitles, contexts)):
+            if self._will_pre_shorten(subtitle, context):
+                logger.info(f"    [{subtitle.index}] [タグ付与保留] 事前短縮でタグも付与します")
+                tagged_texts[i] = None
+            else:
+                pending.append(i)
+        if not pending:
+            return tagged_texts
+
+        items = [
+            {
+                "prev_texts": contexts[i]["prev_texts"],
+                "text": subtitles[i].text,
+                "next_texts": contexts[i]["next_texts"],
+            }
+            for i in pending
+        ]
+        try:
+            results = self.audio_tag_processor.batch_add_tags(items)
+        except Exception as e:
+            logger.warning(
+                f"    [{subtitles[0].index}-{subtitles[-1].index}] "
+                f"[バッチタグ付与エラー] 1件ずつ再試行します: {e}"
+            )
+            results = [
+                self.tag(
+                    subtitles[i],
+                    prev_texts=contexts[i]["prev_texts"],
+                    next_texts=contexts[i]["next_texts"],
+                )
+                for i in pending
+            ]
+
+        for i, tagged_text in zip(pending, results):
+            tagged_texts[i] = tagged_text
+            logger.debug(f"    [{subtitles[i].index}] タグ付き: {tagged_text}")
+        return tagged_texts
+
+    def _will_pre_shorten(self, subtitle: Subtitle, context: dict) -> bool:
+        """
+        文字数モデルの予測から、TTS前の事前短縮が確実に行われるかを判定する
+
+        Args:
+            subtitle: 字幕データ
+            context: prev_entry_end_ms/next_entry_start_msを持つコンテキスト
+
+        Returns:
+            予測が時間枠を明らかに超え、速度調整では収まらない場合はTrue
+        """
+        if not self.gtts_estimator or not self.tts_client or self.max_shorten_retries < 1:
+            return False
+
+        predicted = self.gtts_estimator.predict_duration_ms(subtitle.text, lang=self.lang)
+        if not predicted:
+            return False
+
+        available_start, available_end = self._calculate_available_time_window(
+            subtitle, context["prev_entry_end_ms"], context["next_entry_start_ms"]
+        )
+        available_total = available_end - available_start
+        return (
+            predicted - available_total >= PREDICTION_OVERRUN_MS
+            and available_total / predicted < self.speed_threshold
+        )
 
     def process(
         self,
@@ -48,10 +208,13 @@ class SubtitleProcessor:
         next_texts: list[str] | None = None,
         prev_entry_end_ms: int | None = None,
         next_entry_start_ms: int | None = None,
+        tagged_text: str | None = None,
     ) -> tuple[int, Path | None, str]:
         """
         1つの字幕を処理して音声ファイルを生成する
 
+        synthesizeとfinalizeを続けて実行する。
+
         Args:
             subtitle: 字幕データ
             temp_dir: 一時ファイル用ディレクトリ
@@ -59,35 +222,94 @@ class SubtitleProcessor:
             next_texts: 次のエントリーのテキストリスト
             prev_entry_end_ms: 前のエントリーの終了時間（ミリ秒）
             next_entry_start_ms: 次のエントリーの開始時間（ミリ秒）
+            tagged_text: タグ付け済みテキスト（指定時はタグ付けをスキップ）
 
         Returns:
             (開始時間ms, 音声ファイルパス, タグ付きテキスト)のタプル
         """
-        text = subtitle.text
+        entry = self.synthesize(
+            subtitle,
+            temp_dir,
+            prev_texts=prev_texts,
+            next_texts=next_texts,
+            prev_entry_end_ms=prev_entry_end_ms,
+            next_entry_start_ms=next_entry_start_ms,
+            tagged_text=tagged_text,
+        )
+        return self.finalize(entry, temp_dir)
 
-        # オーディオタグを付与
-        if self.audio_tag_processor:
-            try:
-                tagged_text = self.audio_tag_processor.add_tags(
-                    text,
-                    prev_texts=prev_texts,
-                    next_texts=next_texts,
-                    entry_index=subtitle.index,
-                )
-                print(f"    [タグ付与成功]")
-                print(f"    元テキスト: {text}")
-                print(f"    タグ付き: {tagged_text}")
-                text = tagged_text
-            except Exception as e:
-                print(f"    [タグ付与エラー] {e}")
-                traceback.print_exc()
+    def synthesize(
+        self,
+        subtitle: Subtitle,
+        temp_dir: Path | None,
+        prev_texts: list[str] | None = None,
+        next_texts: list[str] | None = None,
+        prev_entry_end_ms: int | None = None,
+        next_entry_start_ms: int | None = None,
+        tagged_text: str | None = None,
+        tagging_deferred: bool = False,
+    ) -> SynthesizedEntry:
+        """
+        タグ付け・TTS・再意訳までを行う（ネットワーク待ちが中心の段階）
+
+        Args:
+            subtitle: 字幕データ
+            temp_dir: 一時ファイル用ディレクトリ
+            prev_texts: 前のエントリーのテキストリスト
+            next_texts: 次のエントリーのテキストリスト
+            prev_entry_end_ms: 前のエントリーの終了時間（ミリ秒）
+            next_entry_start_ms: 次のエントリーの開始時間（ミリ秒）
+            tagged_text: タグ付け済みテキスト（指定時はタグ付けをスキップ）
+            tagging_deferred: tag_batchでタグ付けを保留した字幕か
+                （事前短縮が行われなかった場合はTTS前にタグ付けする）
+
+        Returns:
+            速度調整前の字幕音声
+        """
+        # オーディオタグを付与（事前にタグ付け済みならそれを使う）
+        if tagging_deferred:
+            text = subtitle.text
+        elif tagged_text is not None:
+            text = tagged_text
+        else:
+            text = self.tag(subtitle, prev_texts=prev_texts, next_texts=next_texts)
 
         # TTSクライアントがない場合はスキップ
         if not self.tts_client or not temp_dir:
-            return (subtitle.start_ms, None, text)
+            if tagging_deferred:
+                text = self.tag(subtitle, prev_texts=prev_texts, next_texts=next_texts)
+            return SynthesizedEntry(subtitle, subtitle.start_ms, None, text)
+
+        # 入力と設定が前回と同じなら、短縮・速度調整まで済んだ結果を再利用する
+        # 短縮結果を左右する設定（補正係数・言語・プロンプト）もキーに含める。
+        # 保留の有無は実行中に学習する補正係数で変わるため含めない
+        entry_key = None
+        if self.audio_cache:
+            entry_key = make_key(
+                "entry",
+                self.tts_client.model,
+                self.tts_client.voice_id,
+                text,
+                repr((prev_texts, next_texts)),
+                repr((subtitle.start_ms, subtitle.end_ms, prev_entry_end_ms, next_entry_start_ms)),
+                repr((self.speed_threshold, self.max_shorten_retries, self.margin_ms)),
+                repr((self.gtts_estimator.estimation_ratio if self.gtts_estimator else None, self.lang)),
+                self.audio_tag_processor.config_key() if self.audio_tag_processor else "",
+            )
+            # JSONと音声の2回の参照を1件のエントリー参照として集計する
+            cached = self.audio_cache.get_json(entry_key)
+            restored = False
+            if cached is not None:
+                suffix = cached.get("suffix", ".mp3")
+                cached_path = temp_dir / f"entry_{subtitle.index}{suffix}"
+                restored = self.audio_cache.get_file(entry_key, cached_path, suffix=suffix)
+            self.audio_cache.record("TTSエントリー", restored)
+            if restored:
+                logger.info(f"    [{subtitle.index}] [キャッシュ] 前回の結果を再利用")
+                return SynthesizedEntry(subtitle, cached["start_ms"], cached_path, cached["text"])
 
         # 音声生成とリトライ処理
-        return self._generate_audio_with_retry(
+        entry = self._generate_audio_with_retry(
             subtitle=subtitle,
             text=text,
             temp_dir=temp_dir,
@@ -95,7 +317,42 @@ class SubtitleProcessor:
             next_texts=next_texts,
             prev_entry_end_ms=prev_entry_end_ms,
             next_entry_start_ms=next_entry_start_ms,
+            tagging_deferred=tagging_deferred,
         )
+        entry.cache_key = entry_key
+        return entry
+
+    def finalize(self, entry: SynthesizedEntry, temp_dir: Path | None) -> tuple[int, Path | None, str]:
+        """
+        必要なら速度調整を行い、結果をキャッシュに保存する（CPU処理が中心の段階）
+
+        Args:
+            entry: synthesizeの結果
+            temp_dir: 一時ファイル用ディレクトリ
+
+        Returns:
+            (開始時間ms, 音声ファイルパス, 最終テキスト)のタプル
+        """
+        audio_path = entry.audio_path
+        if audio_path and entry.target_duration_ms is not None:
+            # 結合時に再デコードしないよう、速度調整後はPCM（WAV）のまま保持する
+            adjusted_path = temp_dir / f"adjusted_{entry.subtitle.index}.wav"
+            adjust_audio_speed(audio_path, entry.target_duration_ms, adjusted_path)
+            logger.info(
+                f"    [{entry.subtitle.index}] 速度調整: "
+                f"{entry.audio_duration_ms}ms -> {entry.target_duration_ms}ms"
+            )
+            audio_path = adjusted_path
+
+        if entry.cache_key and audio_path:
+            # 音声を先に保存し、JSONの存在を完了の目印にする
+            self.audio_cache.put_file(entry.cache_key, audio_path, suffix=audio_path.suffix)
+            self.audio_cache.set_json(
+                entry.cache_key,
+                {"start_ms": entry.start_ms, "text": entry.text, "suffix": audio_path.suffix},
+            )
+
+        return (entry.start_ms, audio_path, entry.text)
 
     def _generate_audio_with_retry(
         self,
@@ -106,10 +363,13 @@ class SubtitleProcessor:
         next_texts: list[str] | None,
         prev_entry_end_ms: int | None,
         next_entry_start_ms: int | None,
-    ) -> tuple[int, Path | None, str]:
+        tagging_deferred: bool = False,
+    ) -> SynthesizedEntry:
         """
         音声生成とリトライ処理を行う
 
+        速度調整は行わず、必要な目標長を結果に記録してfinalizeに任せる。
+
         Args:
             subtitle: 字幕データ
             text: 処理済みテキスト（タグ付き）
@@ -118,9 +378,10 @@ class SubtitleProcessor:
             next_texts: 次のエントリーのテキストリスト
             prev_entry_end_ms: 前のエントリーの終了時間（ミリ秒）
             next_entry_start_ms: 次のエントリーの開始時間（ミリ秒）
+            tagging_deferred: タグ付けを事前短縮に任せて保留した字幕か
 
         Returns:
-            (開始時間ms, 音声ファイルパス, 最終テキスト)のタプル
+            速度調整前の字幕音声
         """
         # 利用可能な時間枠を計算
         available_start, available_end = self._calculate_available_time_window(
@@ -128,6 +389,9 @@ class SubtitleProcessor:
         )
         available_total = available_end - available_start
 
+        # 短縮の履歴（再短縮時に前回の結果をLLMへ伝える）
+        attempts: list[dict] = []
+
         # gTTSによる事前見積もりで短縮が必要か判定
         text, pre_shorten_count = self._pre_shorten_with_gtts(
             text=text,
@@ -135,22 +399,29 @@ class SubtitleProcessor:
             subtitle=subtitle,
             prev_texts=prev_texts,
             next_texts=next_texts,
+            attempts=attempts,
         )
 
+        if tagging_deferred and pre_shorten_count == 0:
+            # 予測の変動や短縮エラーで事前短縮されなかったので、ここでタグを付与する
+            text = self.tag(subtitle, prev_texts=prev_texts, next_texts=next_texts)
+
         for retry in range(self.max_shorten_retries + 1 - pre_shorten_count):
             # 音声を生成
-            raw_audio_path = temp_dir / f"raw_{subtitle.index}.mp3"
-            self.tts_client.synthesize(text, raw_audio_path)
+            raw_audio_path = self._synthesize(text, temp_dir)
 
             # 音声の長さを確認
             audio_duration = get_audio_duration_ms(raw_audio_path)
+            if self.gtts_estimator:
+                # 実際の話速を以降の事前見積もりに反映する
+                self.gtts_estimator.observe_tts_duration(text, audio_duration, lang=self.lang)
 
             if audio_duration <= available_total:
                 # 速度調整不要、配置位置を決定
                 start_ms = self._determine_start_position(
                     subtitle, audio_duration, available_start, available_end
                 )
-                return (start_ms, raw_audio_path, text)
+                return SynthesizedEntry(subtitle, start_ms, raw_audio_path, text)
 
             # 速度調整が必要
             # 速度比を0-1の範囲にクランプ（エッジケース対策）
@@ -158,42 +429,79 @@ class SubtitleProcessor:
 
             if speed_ratio >= self.speed_threshold:
                 # 閾値内なので速度調整して終了
-                return self._adjust_and_return(
-                    subtitle, raw_audio_path, available_total, audio_duration,
-                    temp_dir, text, available_start
+                return SynthesizedEntry(
+                    subtitle, available_start, raw_audio_path, text, available_total, audio_duration
                 )
 
             # 閾値を超えた場合
             if retry == self.max_shorten_retries:
                 # 最大リトライ回数到達: 警告を出して速度調整で続行
-                print(
-                    f"    [警告] 最大リトライ回数到達 "
+                logger.warning(
+                    f"    [{subtitle.index}] [警告] 最大リトライ回数到達 "
                     f"(速度比: {speed_ratio:.2f} < 閾値: {self.speed_threshold})"
                 )
-                return self._adjust_and_return(
-                    subtitle, raw_audio_path, available_total, audio_duration,
-                    temp_dir, text, available_start
+                return SynthesizedEntry(
+                    subtitle, available_start, raw_audio_path, text, available_total, audio_duration
                 )
 
             # 再意訳を依頼
-            text = self._shorten_text(
+            shortened = self._shorten_text(
                 text=text,
                 speed_ratio=speed_ratio,
                 retry=retry,
                 subtitle=subtitle,
                 prev_texts=prev_texts,
                 next_texts=next_texts,
+                duration_ms=audio_duration,
+                available_ms=available_total,
+                attempts=attempts,
             )
 
-            if text is None:
-                # エラー時は速度調整で続行
-                return self._adjust_and_return(
-                    subtitle, raw_audio_path, available_total, audio_duration,
-                    temp_dir, text, available_start
+            if shortened is None:
+                # エラー時は直前のテキストのまま速度調整で続行
+                return SynthesizedEntry(
+                    subtitle, available_start, raw_audio_path, text, available_total, audio_duration
                 )
+            text = shortened
 
         # ここには到達しないはずだが、念のため
-        return (available_start, raw_audio_path, text)
+        return SynthesizedEntry(subtitle, available_start, raw_audio_path, text)
+
+    def _synthesize(self, text: str, temp_dir: Path) -> Path:
+        """
+        TTSで音声を生成する
+
+        ファイル名をテキストのハッシュにし、同じ実行内で同一テキストの音声は
+        1回だけ生成して共有する。さらに同一テキスト・同一ボイスはキャッシュから復元する。
+
+        Args:
+            text: 変換するテキスト
+            temp_dir: 一時ファイル用ディレクトリ
+
+        Returns:
+            音声ファイルのパス（内容は以降書き換えられない）
+        """
+        key = make_key("elevenlabs", self.tts_client.model, self.tts_client.voice_id, text)
+        output_path = temp_dir / f"raw_{key[:16]}.mp3"
+
+        with self._synth_locks_lock:
+            lock = self._synth_locks.setdefault(key, threading.Lock())
+
+        # 同じテキストを並行して処理している場合は、先に始めた方の完了を待つ
+        with lock:
+            if key in self._synthesized:
+                logger.debug(f"    [TTS] 生成済みの音声を共有: {output_path.name}")
+                return output_path
+
+            if self.audio_cache and self.audio_cache.get_file(key, output_path, stat="TTS音声"):
+                logger.debug(f"    [TTSキャッシュ] ヒット: {output_path.name}")
+            else:
+                self.tts_client.synthesize(text, output_path)
+                if self.audio_cache:
+                    self.audio_cache.put_file(key, output_path)
+
+            self._synthesized.add(key)
+        return output_path
 
     def _calculate_available_time_window(
         self,
@@ -280,22 +588,6 @@ class SubtitleProcessor:
             # 後側に余裕がある: 開始位置は維持（後ろにはみ出す）
             return subtitle.start_ms
 
-    def _adjust_and_return(
-        self,
-        subtitle: Subtitle,
-        raw_audio_path: Path,
-        target_duration: int,
-        audio_duration: int,
-        temp_dir: Path,
-        text: str,
-        start_ms: int | None = None,
-    ) -> tuple[int, Path, str]:
-        """速度調整して結果を返す"""
-        adjusted_path = temp_dir / f"adjusted_{subtitle.index}.mp3"
-        adjust_audio_speed(raw_audio_path, target_duration, adjusted_path)
-        print(f"    速度調整: {audio_duration}ms -> {target_duration}ms")
-        return (start_ms if start_ms is not None else subtitle.start_ms, adjusted_path, text)
-
     def _shorten_text(
         self,
         text: str,
@@ -304,18 +596,30 @@ class SubtitleProcessor:
         subtitle: Subtitle,
         prev_texts: list[str] | None,
         next_texts: list[str] | None,
+        duration_ms: int,
+        available_ms: int,
+        attempts: list[dict],
     ) -> str | None:
-        """テキストを短縮する。エラー時はNoneを返す"""
+        """
+        テキストを短縮する。エラー時はNoneを返す
+
+        textが前回の短縮結果であれば、その音声長とともに前回のやり取りをLLMに渡す。
+        成功した短縮はattemptsに追記する。
+        """
         if not self.audio_tag_processor:
             return None
 
+        previous_attempt = None
+        if attempts and attempts[-1]["shortened_text"] == text:
+            previous_attempt = {**attempts[-1], "duration_ms": duration_ms, "available_ms": available_ms}
+
         # 文字数削減の目標値は速度比の85%
         target_char_ratio = speed_ratio * 0.85
-        print(
-            f"    [再意訳] 速度比 {speed_ratio:.2f} < 閾値 {self.speed_threshold} "
+        logger.info(
+            f"    [{subtitle.index}] [再意訳] 速度比 {speed_ratio:.2f} < 閾値 {self.speed_threshold} "
             f"-> 目標 {target_char_ratio:.0%} に短縮 (リトライ {retry + 1}/{self.max_shorten_retries})"
         )
-        print(f"    元テキスト: {text}")
+        logger.debug(f"    [{subtitle.index}] 元テキスト: {text}")
 
         try:
             shortened_text = self.audio_tag_processor.shorten_text(
@@ -324,12 +628,15 @@ class SubtitleProcessor:
                 prev_texts=prev_texts,
                 next_texts=next_texts,
                 entry_index=subtitle.index,
+                previous_attempt=previous_attempt,
+            )
+            logger.info(f"    [{subtitle.index}] 短縮後: {shortened_text}")
+            attempts.append(
+                {"text": text, "target_ratio": target_char_ratio, "shortened_text": shortened_text}
             )
-            print(f"    短縮後: {shortened_text}")
             return shortened_text
         except Exception as e:
-            print(f"    [再意訳エラー] {e}")
-            traceback.print_exc()
+            logger.exception(f"    [{subtitle.index}] [再意訳エラー] {e}")
             return None
 
     def _pre_shorten_with_gtts(
@@ -339,6 +646,7 @@ class SubtitleProcessor:
         subtitle: Subtitle,
         prev_texts: list[str] | None,
         next_texts: list[str] | None,
+        attempts: list[dict],
     ) -> tuple[str, int]:
         """
         gTTSで事前見積もりを行い、必要なら短縮を行う
@@ -353,6 +661,7 @@ class SubtitleProcessor:
             subtitle: 字幕データ
             prev_texts: 前のエントリーのテキストリスト
             next_texts: 次のエントリーのテキストリスト
+            attempts: 短縮の履歴（短縮に成功するたびに追記される）
 
         Returns:
             (処理後テキスト, 事前短縮した回数)のタプル
@@ -363,22 +672,31 @@ class SubtitleProcessor:
         shorten_count = 0
 
         for retry in range(self.max_shorten_retries):
-            try:
-                estimated_duration = self.gtts_estimator.estimate_duration_ms(text, lang=self.lang)
-            except Exception as e:
-                print(f"    [gTTS見積もりエラー] {e}")
-                break
+            # 文字数モデルの予測が明らかに収まる/超える場合はgTTSを呼ばず、
+            # 境界付近の場合のみgTTSで実測する
+            predicted = self.gtts_estimator.predict_duration_ms(text, lang=self.lang)
+            if predicted is not None and predicted <= available_total * PREDICTION_SAFETY_RATIO:
+                return (text, shorten_count)
+
+            if predicted is not None and predicted - available_total >= PREDICTION_OVERRUN_MS:
+                estimated_duration = predicted
+            else:
+                try:
+                    estimated_duration = self.gtts_estimator.estimate_duration_ms(text, lang=self.lang)
+                except Exception as e:
+                    logger.warning(f"    [{subtitle.index}] [gTTS見積もりエラー] {e}")
+                    break
 
             if estimated_duration <= available_total:
                 # 時間内に収まる見込み
                 if shorten_count > 0:
-                    print(f"    [gTTS見積もり] 短縮後OK: {estimated_duration}ms <= {available_total}ms")
+                    logger.info(f"    [{subtitle.index}] [gTTS見積もり] 短縮後OK: {estimated_duration}ms <= {available_total}ms")
                 return (text, shorten_count)
 
             # 時間内に収まらない
             speed_ratio = available_total / estimated_duration
-            print(
-                f"    [gTTS見積もり] 時間超過: {estimated_duration}ms > {available_total}ms "
+            logger.info(
+                f"    [{subtitle.index}] [gTTS見積もり] 時間超過: {estimated_duration}ms > {available_total}ms "
                 f"(速度比: {speed_ratio:.2f})"
             )
 
@@ -397,6 +715,9 @@ class SubtitleProcessor:
                 subtitle=subtitle,
                 prev_texts=prev_texts,
                 next_texts=next_texts,
+                duration_ms=estimated_duration,
+                available_ms=available_total,
+                attempts=attempts,
             )
 
             if shortened is None:
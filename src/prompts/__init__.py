@@ -1,11 +1,13 @@
 """プロンプト管理モジュール"""
 
+from functools import lru_cache
 from pathlib import Path
 
 
+@lru_cache(maxsize=None)
 def load_prompt(name: str) -> str:
     """
-    プロンプトファイルを読み込む
+    プロンプトファイルを読み込む（プロセス内で1ファイル1回のみ読む）
 
     Args:
         name: プロンプト名（拡張子なし）